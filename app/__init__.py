@@ -5,3 +5,11 @@
 @DateTime: 2025/06/25 00:15:06
 @Docs:
 """
+
+import os
+
+from config.app_config import AppConfig
+
+# Polars 只在首次导入时读取线程数配置，需要在任何模块导入 polars 之前设置；已设置的环境变量优先
+os.environ.setdefault("POLARS_MAX_THREADS", str(AppConfig.POLARS_MAX_THREADS))
+os.environ.setdefault("POLARS_STREAMING_CHUNK_SIZE", str(AppConfig.POLARS_STREAMING_CHUNK_SIZE))
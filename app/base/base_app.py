@@ -17,6 +17,10 @@ class BaseApp(ABC):
     定义所有应用必须实现的基础方法
     """
 
+    # 是否作为片段渲染，应用内的组件交互只重新运行应用本身；
+    # 应用内有切换应用的操作时设为False，在整页运行中渲染
+    render_as_fragment = True
+
     @abstractmethod
     def get_name(self) -> str:
         """获取应用名称
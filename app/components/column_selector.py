@@ -9,6 +9,32 @@
 import polars as pl
 import streamlit as st
 
+from app.utils.cache_utils import DATAFRAME_CACHE_MAX_ENTRIES, DATAFRAME_HASH_FUNCS, compute_column_stats
+from config.app_config import AppConfig
+from config.ui_config import UIConfig
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs=DATAFRAME_HASH_FUNCS,
+    max_entries=DATAFRAME_CACHE_MAX_ENTRIES,
+    ttl=AppConfig.CACHE_TTL,
+)
+def _preview_selected_columns(df: pl.DataFrame, columns: tuple[str, ...], max_rows: int) -> pl.DataFrame:
+    """获取选中字段的预览数据（带缓存）
+
+    通过惰性查询只投影选中的字段，避免对整个DataFrame做切片
+
+    Args:
+        df: 数据DataFrame
+        columns: 选中的字段元组
+        max_rows: 最大预览行数
+
+    Returns:
+        预览数据
+    """
+    return df.lazy().select(columns).head(max_rows).collect()
+
 
 class ColumnSelector:
     """字段选择器
@@ -37,9 +63,15 @@ class ColumnSelector:
             default_selection = default_selected or []
 
         # 字段选择
-        selected_columns = st.multiselect(
-            "选择要导出的字段：", options=available_columns, default=default_selection, help="选择需要导出的数据字段"
-        )
+        if select_all and self._is_wide(available_columns):
+            # 字段过多时全选不渲染多选框，避免前端渲染全部选项
+            selected_columns = list(available_columns)
+            st.caption(f"已全选 {len(available_columns)} 个字段，取消全选后可搜索并选择部分字段")
+        else:
+            query = self._render_column_filter(available_columns, key="column_filter")
+            selected_columns = self._render_column_multiselect(
+                available_columns, default_selection, query, state_key="column_selector_selected"
+            )
 
         # 显示选择摘要
         if selected_columns:
@@ -59,6 +91,12 @@ class ColumnSelector:
         Returns:
             元组：(选中的字段列表, 是否已确认)
         """
+        # df.columns 每次访问都会新建列表，这里只取一次
+        columns = df.columns
+
+        # 字段筛选框放在表单外，输入后即可刷新可选字段
+        query = self._render_column_filter(columns, key="column_selection_filter")
+
         # 使用 st.form 来防止每次选择都触发重新加载
         with st.form("column_selection_form"):
             st.subheader("🎯 选择导出字段")
@@ -67,18 +105,23 @@ class ColumnSelector:
             select_all = st.checkbox("全选/取消全选", value=True)
 
             if select_all:
-                default_selection = df.columns
+                default_selection = columns
             else:
                 default_selection = []
 
             # 字段选择
-            selected_columns = st.multiselect(
-                "选择要导出的字段：", options=df.columns, default=default_selection, help="选择需要导出的数据字段"
-            )
+            if select_all and self._is_wide(columns):
+                # 字段过多时全选不渲染多选框，避免前端渲染全部选项
+                selected_columns = columns
+                st.caption(f"已全选 {df.width} 个字段，取消全选后可搜索并选择部分字段")
+            else:
+                selected_columns = self._render_column_multiselect(
+                    columns, default_selection, query, state_key="column_selection_selected"
+                )
 
             # 显示选择摘要
             if selected_columns:
-                st.info(f"已选择 {len(selected_columns)} / {len(df.columns)} 个字段")
+                st.info(f"已选择 {len(selected_columns)} / {df.width} 个字段")
             else:
                 st.warning("请至少选择一个字段")
 
@@ -98,7 +141,7 @@ class ColumnSelector:
 
             # 显示字段预览
             st.subheader("👀 选择字段预览")
-            preview_df = df.select(selected_columns).head(max_preview_rows)
+            preview_df = _preview_selected_columns(df, tuple(selected_columns), max_preview_rows)
             st.dataframe(preview_df, use_container_width=True)
 
             # 显示字段详细信息
@@ -109,6 +152,81 @@ class ColumnSelector:
         # 如果没有确认，返回空列表和False
         return [], False
 
+    @staticmethod
+    def _is_wide(available_columns: list[str]) -> bool:
+        """判断字段数量是否超过筛选阈值
+
+        Args:
+            available_columns: 可用字段列表
+
+        Returns:
+            是否需要启用字段筛选
+        """
+        return len(available_columns) > UIConfig.COLUMN_FILTER_THRESHOLD
+
+    def _render_column_filter(self, available_columns: list[str], key: str) -> str:
+        """渲染字段搜索框，字段数量未超过阈值时不渲染
+
+        Args:
+            available_columns: 可用字段列表
+            key: 组件键名
+
+        Returns:
+            搜索关键字
+        """
+        if not self._is_wide(available_columns):
+            return ""
+
+        return st.text_input(
+            "🔍 搜索字段：",
+            key=key,
+            help=f"字段数量较多（{len(available_columns)} 个），仅显示匹配的前 {UIConfig.MAX_COLUMN_OPTIONS} 个字段",
+        )
+
+    def _render_column_multiselect(
+        self, available_columns: list[str], default_selection: list[str], query: str, state_key: str
+    ) -> list[str]:
+        """渲染字段多选框
+
+        字段数量超过阈值时只向前端推送匹配搜索关键字的前N个字段，已选字段始终保留在选项中
+
+        Args:
+            available_columns: 可用字段列表
+            default_selection: 默认选中的字段列表
+            query: 搜索关键字
+            state_key: 保存已选字段的会话状态键名
+
+        Returns:
+            选中的字段列表
+        """
+        if not self._is_wide(available_columns):
+            return st.multiselect(
+                "选择要导出的字段：",
+                options=available_columns,
+                default=default_selection,
+                help="选择需要导出的数据字段",
+            )
+
+        # 多选框使用固定的组件键名，搜索关键字变化导致选项变化时保留当前选择；
+        # 多选框未渲染时组件状态会被清除，已选字段另存一份用于恢复
+        widget_key = f"{state_key}_widget"
+        available_set = set(available_columns)
+        source = st.session_state.get(widget_key, st.session_state.get(state_key, default_selection))
+        previous = [col for col in source if col in available_set]
+        st.session_state[widget_key] = previous
+
+        keyword = query.strip().lower()
+        filtered = [col for col in available_columns if keyword in col.lower()][: UIConfig.MAX_COLUMN_OPTIONS]
+
+        selected_columns = st.multiselect(
+            "选择要导出的字段：",
+            options=list(dict.fromkeys([*previous, *filtered])),
+            key=widget_key,
+            help="选择需要导出的数据字段，可通过上方搜索框查找更多字段",
+        )
+        st.session_state[state_key] = selected_columns
+        return selected_columns
+
     def show_column_info(self, df: pl.DataFrame, selected_columns: list[str]) -> None:
         """显示选中字段的详细信息
 
@@ -121,19 +239,29 @@ class ColumnSelector:
 
         st.subheader("📊 字段详细信息")
 
-        column_info = []
-        for col in selected_columns:
-            if col in df.columns:
-                col_data = df[col]
-                info = {
-                    "字段名": col,
-                    "数据类型": str(col_data.dtype),
-                    "空值数": col_data.null_count(),
-                    "唯一值数": col_data.n_unique(),
-                    "空值比例": f"{col_data.null_count() / len(df) * 100:.1f}%" if len(df) > 0 else "0%",
-                }
-                column_info.append(info)
-
-        if column_info:
-            info_df = pl.DataFrame(column_info)
+        # 按列直接构建各字段的数据，避免逐行字典再转换为列式结构
+        names, dtypes, nulls, uniques, ratios = [], [], [], [], []
+        unique_label = "唯一值数"
+        total_rows = df.height
+        for stats in compute_column_stats(df, tuple(selected_columns)):
+            null_count = stats["null_count"]
+            names.append(stats["name"])
+            dtypes.append(stats["dtype"])
+            nulls.append(null_count)
+            uniques.append(stats["unique_count"])
+            if stats["unique_approx"]:
+                unique_label = "唯一值数(≈)"
+            ratios.append(f"{null_count / total_rows * 100:.1f}%" if total_rows > 0 else "0%")
+
+        if names:
+            info_df = pl.DataFrame(
+                {"字段名": names, "数据类型": dtypes, "空值数": nulls, unique_label: uniques, "空值比例": ratios},
+                schema={
+                    "字段名": pl.Utf8,
+                    "数据类型": pl.Utf8,
+                    "空值数": pl.Int64,
+                    unique_label: pl.Int64,
+                    "空值比例": pl.Utf8,
+                },
+            )
             st.dataframe(info_df, use_container_width=True)
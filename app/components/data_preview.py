@@ -9,6 +9,47 @@
 import polars as pl
 import streamlit as st
 
+from app.utils.cache_utils import DATAFRAME_CACHE_MAX_ENTRIES, DATAFRAME_HASH_FUNCS, compute_column_stats
+from config.app_config import AppConfig
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs=DATAFRAME_HASH_FUNCS,
+    max_entries=DATAFRAME_CACHE_MAX_ENTRIES,
+    ttl=AppConfig.CACHE_TTL,
+)
+def _summary_metrics(df: pl.DataFrame) -> tuple[int, int, float, int]:
+    """计算数据摘要指标（带缓存）
+
+    Args:
+        df: 数据DataFrame
+
+    Returns:
+        元组：(总行数, 总列数, 内存使用MB, 空值总数)
+    """
+    null_count = df.select(pl.sum_horizontal(pl.all().null_count())).item() if df.width > 0 else 0
+    return df.height, df.width, df.estimated_size() / 1024 / 1024, null_count
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs=DATAFRAME_HASH_FUNCS,
+    max_entries=DATAFRAME_CACHE_MAX_ENTRIES,
+    ttl=AppConfig.CACHE_TTL,
+)
+def _head_slice(df: pl.DataFrame, rows: int) -> pl.DataFrame:
+    """获取前N行数据（带缓存）
+
+    Args:
+        df: 数据DataFrame
+        rows: 行数
+
+    Returns:
+        前N行数据
+    """
+    return df.lazy().head(rows).collect()
+
 
 class DataPreview:
     """数据预览组件
@@ -30,19 +71,20 @@ class DataPreview:
         Args:
             df: 要预览的数据框
         """
+        total_rows, total_columns, size_mb, null_count = _summary_metrics(df)
+
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("总行数", f"{len(df):,}")
+            st.metric("总行数", f"{total_rows:,}")
 
         with col2:
-            st.metric("总列数", len(df.columns))
+            st.metric("总列数", total_columns)
 
         with col3:
-            st.metric("内存使用", f"{df.estimated_size() / 1024 / 1024:.2f} MB")
+            st.metric("内存使用", f"{size_mb:.2f} MB")
 
         with col4:
-            null_count = df.null_count().sum_horizontal().item()
             st.metric("空值数量", f"{null_count:,}")
 
     def render_sample_data(self, df: pl.DataFrame, rows: int | None = None) -> None:
@@ -56,9 +98,10 @@ class DataPreview:
 
         st.subheader("📋 数据预览")
 
-        if len(df) > display_rows:
-            st.info(f"显示前 {display_rows} 行数据，共 {len(df)} 行")
-            st.dataframe(df.head(display_rows), use_container_width=True)
+        total_rows = df.height
+        if total_rows > display_rows:
+            st.info(f"显示前 {display_rows} 行数据，共 {total_rows} 行")
+            st.dataframe(_head_slice(df, display_rows), use_container_width=True)
         else:
             st.dataframe(df, use_container_width=True)
 
@@ -70,21 +113,28 @@ class DataPreview:
         """
         st.subheader("📊 列信息")
 
-        column_info = []
-        for col in df.columns:
-            dtype = str(df[col].dtype)
-            null_count = df[col].null_count()
-            unique_count = df[col].n_unique()
-
-            column_info.append(
-                {
-                    "列名": col,
-                    "数据类型": dtype,
-                    "空值数": null_count,
-                    "唯一值数": unique_count,
-                    "空值比例": f"{null_count / len(df) * 100:.1f}%",
-                }
-            )
-
-        info_df = pl.DataFrame(column_info)
+        # 按列直接构建各字段的数据，避免逐行字典再转换为列式结构
+        names, dtypes, nulls, uniques, ratios = [], [], [], [], []
+        unique_label = "唯一值数"
+        total_rows = df.height
+        for stats in compute_column_stats(df, tuple(df.columns)):
+            null_count = stats["null_count"]
+            names.append(stats["name"])
+            dtypes.append(stats["dtype"])
+            nulls.append(null_count)
+            uniques.append(stats["unique_count"])
+            if stats["unique_approx"]:
+                unique_label = "唯一值数(≈)"
+            ratios.append(f"{null_count / total_rows * 100:.1f}%")
+
+        info_df = pl.DataFrame(
+            {"列名": names, "数据类型": dtypes, "空值数": nulls, unique_label: uniques, "空值比例": ratios},
+            schema={
+                "列名": pl.Utf8,
+                "数据类型": pl.Utf8,
+                "空值数": pl.Int64,
+                unique_label: pl.Int64,
+                "空值比例": pl.Utf8,
+            },
+        )
         st.dataframe(info_df, use_container_width=True)
@@ -6,6 +6,7 @@
 @Docs: 错误处理组件
 """
 
+import time
 from collections.abc import Callable
 from typing import Any
 
@@ -20,6 +21,39 @@ class ErrorHandler:
     提供统一的错误显示和处理功能，并记录日志
     """
 
+    # 相同消息在该时间窗口（秒）内只记录一次日志
+    LOG_DEDUP_SECONDS = 5.0
+    # 已记录消息在会话状态中的键名
+    _SEEN_KEY = "_err_seen"
+
+    @staticmethod
+    def _should_log(*parts: Any) -> bool:
+        """判断消息是否需要记录日志
+
+        重新运行时同一错误可能被反复触发，时间窗口内的重复消息只显示不记录
+
+        Args:
+            *parts: 组成消息标识的内容
+
+        Returns:
+            是否需要记录日志
+        """
+        key = hash(parts)
+        seen: dict[int, float] = st.session_state.setdefault(ErrorHandler._SEEN_KEY, {})
+        now = time.monotonic()
+
+        last = seen.get(key)
+        if last is not None and now - last < ErrorHandler.LOG_DEDUP_SECONDS:
+            return False
+
+        # 记录新消息时清理时间窗口外的记录，避免会话内的记录无限增长
+        expired = [k for k, t in seen.items() if now - t >= ErrorHandler.LOG_DEDUP_SECONDS]
+        for k in expired:
+            del seen[k]
+
+        seen[key] = now
+        return True
+
     @staticmethod
     def show_error(message: str, details: str | None = None) -> None:
         """显示错误信息
@@ -29,10 +63,11 @@ class ErrorHandler:
             details: 错误详情（可选）
         """
         # 记录错误日志
-        if details:
-            logger.error(f"错误: {message} | 详情: {details}")
-        else:
-            logger.error(f"错误: {message}")
+        if ErrorHandler._should_log("error", message, details):
+            if details:
+                logger.error(f"错误: {message} | 详情: {details}")
+            else:
+                logger.error(f"错误: {message}")
 
         # 显示错误信息
         st.error(f"❌ {message}")
@@ -47,7 +82,8 @@ class ErrorHandler:
         Args:
             message: 警告消息
         """
-        logger.warning(f"警告: {message}")
+        if ErrorHandler._should_log("warning", message):
+            logger.warning(f"警告: {message}")
         st.warning(f"⚠️ {message}")
 
     @staticmethod
@@ -7,13 +7,42 @@
 """
 
 from datetime import datetime
+from io import BytesIO
 
 import polars as pl
 import streamlit as st
 
 from app.components.error_handler import ErrorHandler
 from app.handlers.export_handler import ExportHandler
+from app.utils.cache_utils import DATAFRAME_CACHE_MAX_ENTRIES, DATAFRAME_HASH_FUNCS, dataframe_fingerprint
 from app.utils.logger import log_function_calls, logger
+from config.app_config import AppConfig
+from config.ui_config import UIConfig
+
+# 导出结果在会话状态中的键名
+EXPORT_RESULT_KEY = "_export_result"
+# 默认导出文件名在会话状态中的键名
+EXPORT_FILENAME_KEY = "_export_default_filename"
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs=DATAFRAME_HASH_FUNCS,
+    max_entries=DATAFRAME_CACHE_MAX_ENTRIES,
+    ttl=AppConfig.CACHE_TTL,
+)
+def _export_summary(_export_handler: ExportHandler, df: pl.DataFrame, selected_columns: tuple[str, ...]) -> dict:
+    """获取导出摘要（带缓存）
+
+    Args:
+        _export_handler: 导出处理器（不参与缓存键计算）
+        df: 要导出的DataFrame
+        selected_columns: 选择的列名元组
+
+    Returns:
+        导出摘要信息字典
+    """
+    return _export_handler.get_export_summary(df, list(selected_columns))
 
 
 class ExportPanel:
@@ -35,18 +64,26 @@ class ExportPanel:
             df: 数据DataFrame
             selected_columns: 选中的字段列表
         """
-        logger.info(f"渲染导出面板 | 数据行数: {len(df)} | 选择字段数: {len(selected_columns)}")
+        logger.info(f"渲染导出面板 | 数据行数: {df.height} | 选择字段数: {len(selected_columns)}")
 
         st.subheader("📤 导出数据")
 
-        default_filename = f"export_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # 默认文件名只生成一次，避免时间戳变化导致输入框在每次重新运行时被重置
+        if EXPORT_FILENAME_KEY not in st.session_state:
+            st.session_state[EXPORT_FILENAME_KEY] = f"export_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        default_filename = st.session_state[EXPORT_FILENAME_KEY]
         filename = st.text_input("文件名：", value=default_filename, help="不需要包含文件扩展名")
 
-        # 导出格式固定为xlsx
-        export_format = "xlsx"
+        # xlsx 兼容性最好；数据量较大时 csv / parquet 生成速度快得多
+        export_format = st.selectbox(
+            "导出格式：",
+            options=UIConfig.EXPORT_FORMATS,
+            index=UIConfig.EXPORT_FORMATS.index(UIConfig.DEFAULT_EXPORT_FORMAT),
+            help="大数据量时推荐使用 csv 或 parquet，生成速度更快",
+        )
 
         try:
-            export_summary = self.export_handler.get_export_summary(df, selected_columns)
+            export_summary = _export_summary(self.export_handler, df, tuple(selected_columns))
             logger.debug(
                 f"导出摘要生成 | 行数: {export_summary['total_rows']} | 预估大小: {export_summary['estimated_size']}"
             )
@@ -61,51 +98,70 @@ class ExportPanel:
             with st.expander("📋 导出字段列表"):
                 st.write(selected_columns)
 
+            export_key = hash((dataframe_fingerprint(df), tuple(selected_columns), export_format))
+
             if st.button("🚀 生成导出文件", type="primary", use_container_width=True):
                 logger.info(f"用户点击导出按钮 | 文件名: {filename} | 格式: {export_format}")
-                self._handle_export(df, selected_columns, filename, export_format)
+                self._handle_export(df, selected_columns, export_format, export_key)
+
+            # 已生成的导出文件保存在会话状态中，重新运行时直接复用，无需重新生成
+            self._render_download_button(export_key, filename, export_format)
 
         except Exception as e:
             logger.exception(f"导出面板渲染失败: {str(e)}")
             ErrorHandler.show_error("导出面板显示失败", str(e))
 
     @log_function_calls()
-    def _handle_export(self, df: pl.DataFrame, columns: list[str], filename: str, file_format: str):
+    def _handle_export(self, df: pl.DataFrame, columns: list[str], export_format: str, export_key: int):
         """处理导出操作
 
         Args:
             df: 数据DataFrame
             columns: 要导出的字段列表
-            filename: 文件名
-            file_format: 文件格式
+            export_format: 导出格式
+            export_key: 导出内容的标识，用于复用已生成的文件
         """
-        logger.info(
-            f"开始处理导出 | 文件名: {filename} | 格式: {file_format} | 数据行数: {len(df)} | 导出字段数: {len(columns)}"
-        )
+        cached = st.session_state.get(EXPORT_RESULT_KEY)
+        if cached is not None and cached["key"] == export_key:
+            logger.info("导出内容未变化，复用已生成的文件")
+            ErrorHandler.show_success("文件已生成，请点击下方按钮下载。")
+            return
+
+        logger.info(f"开始处理导出 | 数据行数: {df.height} | 导出字段数: {len(columns)}")
 
         with st.spinner("正在生成导出文件..."):
             try:
-                # 导出数据
-                export_data = self.export_handler.export_excel(df, columns)
-                download_filename = f"{filename}.{file_format}"
-
-                logger.info(f"文件导出成功 | 文件名: {download_filename} | 文件大小: {len(export_data)} bytes")
-
-                # 直接显示下载按钮
-                st.download_button(
-                    label="💾 下载文件",
-                    data=export_data,
-                    file_name=download_filename,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True,
-                    key="download_button",
-                )
-
-                success_msg = f"文件已生成：{download_filename}"
-                logger.info(success_msg)
-                ErrorHandler.show_success("文件已生成，请点击上方按钮下载。")
+                # 直接写入字节流，下载按钮复用同一个缓冲区
+                output = BytesIO()
+                file_size = self.export_handler.export_to_buffer(df, output, columns, export_format)
+                st.session_state[EXPORT_RESULT_KEY] = {"key": export_key, "data": output}
+
+                logger.info(f"文件导出成功 | 文件大小: {file_size} bytes")
+                ErrorHandler.show_success("文件已生成，请点击下方按钮下载。")
 
             except Exception as e:
+                st.session_state.pop(EXPORT_RESULT_KEY, None)
                 error_msg = f"导出失败: {str(e)}"
                 logger.exception(error_msg)
                 ErrorHandler.show_error("导出失败", str(e))
+
+    def _render_download_button(self, export_key: int, filename: str, file_format: str) -> None:
+        """渲染下载按钮，仅当已生成的文件与当前导出内容一致时显示
+
+        Args:
+            export_key: 导出内容的标识
+            filename: 文件名
+            file_format: 文件格式
+        """
+        cached = st.session_state.get(EXPORT_RESULT_KEY)
+        if cached is None or cached["key"] != export_key:
+            return
+
+        st.download_button(
+            label="💾 下载文件",
+            data=cached["data"],
+            file_name=f"{filename}.{file_format}",
+            mime=self.export_handler.get_mime_type(file_format),
+            use_container_width=True,
+            key="download_button",
+        )
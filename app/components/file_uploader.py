@@ -6,12 +6,82 @@
 @Docs: 文件上传组件
 """
 
+from typing import Any
+
+import polars as pl
 import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 
 from app.utils.file_validator import FileValidator
 from app.utils.logger import log_function_calls, logger
 
 
+def _uploaded_file_identity(file: UploadedFile) -> tuple:
+    """上传文件的缓存标识，避免对文件内容做哈希"""
+    return (getattr(file, "file_id", None), file.name, file.size, getattr(file, "type", None))
+
+
+def _file_validator_identity(file_validator: FileValidator) -> tuple:
+    """文件验证器的缓存标识，验证规则相同则视为同一个验证器"""
+    return (file_validator.max_size, tuple(file_validator.supported_formats))
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={UploadedFile: _uploaded_file_identity, FileValidator: _file_validator_identity},
+)
+def _validate_files_cached(file_validator: FileValidator, files: list) -> list[dict]:
+    """验证文件（带缓存）
+
+    同一批文件在无关组件交互触发重新运行时直接复用验证结果
+
+    Args:
+        file_validator: 文件验证器实例
+        files: 文件列表
+
+    Returns:
+        验证结果列表
+    """
+    total = len(files)
+    logger.debug("开始验证文件 | 文件数量: {}", total)
+
+    # 循环内使用 loguru 的参数化日志，日志级别未启用时不会格式化消息
+    results = []
+    for i, file in enumerate(files, 1):
+        logger.debug("验证文件 {}/{}: {}", i, total, file.name)
+
+        result: dict[str, Any] = {"valid": True, "errors": [], "warnings": []}
+
+        try:
+            # 文件格式验证
+            if not file_validator.validate_file_format(file):
+                result["valid"] = False
+                result["errors"].append("不支持的文件格式")
+                logger.warning("文件格式验证失败: {}", file.name)
+
+            # 文件大小验证
+            if not file_validator.validate_file_size(file):
+                result["valid"] = False
+                result["errors"].append("文件大小超过限制")
+                logger.warning("文件大小验证失败: {}", file.name)
+
+            if result["valid"]:
+                logger.debug("文件验证通过: {}", file.name)
+            else:
+                logger.warning("文件验证失败: {} | 错误: {}", file.name, result["errors"])
+
+        except Exception as e:
+            result["valid"] = False
+            result["errors"].append(f"验证过程出错: {str(e)}")
+            logger.exception("文件验证异常: {} | 错误: {}", file.name, e)
+
+        results.append(result)
+
+    valid_count = sum(1 for r in results if r["valid"])
+    logger.info("文件验证完成 | 通过: {}/{}", valid_count, total)
+    return results
+
+
 class FileUploader:
     """文件上传器
 
@@ -46,15 +116,15 @@ class FileUploader:
         if uploaded_files:
             logger.info(f"用户上传了 {len(uploaded_files)} 个文件")
 
-            # 记录文件信息
-            for file in uploaded_files:
-                file_info = self.file_validator.get_file_info(file)
+            # 每个文件只获取一次文件信息，供日志和上传状态复用
+            file_infos = {id(file): self.file_validator.get_file_info(file) for file in uploaded_files}
+            for file_info in file_infos.values():
                 logger.debug(
-                    f"上传文件: {file_info['name']} | 大小: {file_info['size']} | 类型: {file_info['extension']}"
+                    "上传文件: {} | 大小: {} | 类型: {}", file_info["name"], file_info["size"], file_info["extension"]
                 )
 
             validation_results = self.validate_files(uploaded_files)
-            self.show_upload_status(uploaded_files, validation_results)
+            self.show_upload_status(uploaded_files, validation_results, file_infos)
 
             # 只返回验证通过的文件
             valid_files = [f for f, result in zip(uploaded_files, validation_results, strict=False) if result["valid"]]
@@ -64,7 +134,6 @@ class FileUploader:
         logger.debug("没有文件上传")
         return []
 
-    @log_function_calls()
     def validate_files(self, files: list) -> list[dict]:
         """验证文件
 
@@ -74,80 +143,39 @@ class FileUploader:
         Returns:
             验证结果列表
         """
-        logger.debug(f"开始验证文件 | 文件数量: {len(files)}")
-
-        results = []
-        for i, file in enumerate(files):
-            logger.debug(f"验证文件 {i + 1}/{len(files)}: {file.name}")
-
-            result = {"valid": True, "errors": [], "warnings": []}
-
-            try:
-                # 文件格式验证
-                if not self.file_validator.validate_file_format(file):
-                    result["valid"] = False
-                    result["errors"].append("不支持的文件格式")
-                    logger.warning(f"文件格式验证失败: {file.name}")
-
-                # 文件大小验证
-                if not self.file_validator.validate_file_size(file):
-                    result["valid"] = False
-                    result["errors"].append("文件大小超过限制")
-                    logger.warning(f"文件大小验证失败: {file.name}")
-
-                if result["valid"]:
-                    logger.debug(f"文件验证通过: {file.name}")
-                else:
-                    logger.warning(f"文件验证失败: {file.name} | 错误: {result['errors']}")
-
-            except Exception as e:
-                result["valid"] = False
-                result["errors"].append(f"验证过程出错: {str(e)}")
-                logger.exception(f"文件验证异常: {file.name} | 错误: {str(e)}")
-
-            results.append(result)
-
-        valid_count = sum(1 for r in results if r["valid"])
-        logger.info(f"文件验证完成 | 通过: {valid_count}/{len(files)}")
-        return results
+        return _validate_files_cached(self.file_validator, files)
 
-    def show_upload_status(self, files: list, validation_results: list[dict]) -> None:
+    def show_upload_status(
+        self, files: list, validation_results: list[dict], file_infos: dict[int, dict[str, Any]] | None = None
+    ) -> None:
         """显示上传状态
 
         Args:
             files: 文件列表
             validation_results: 验证结果列表
+            file_infos: 以文件对象id为键的文件信息，缺失时重新获取
         """
+        file_infos = file_infos or {}
+
         logger.debug("显示文件上传状态")
 
+        # 汇总为一个表格渲染，避免每个文件创建多个组件
+        names, statuses, sizes, messages = [], [], [], []
         for file, result in zip(files, validation_results, strict=False):
-            col1, col2, col3 = st.columns([3, 1, 1])
-
-            with col1:
-                st.text(f"📄 {file.name}")
-
-            with col2:
-                if result["valid"]:
-                    st.success("✅")
-                else:
-                    st.error("❌")
-
-            with col3:
-                try:
-                    file_info = self.file_validator.get_file_info(file)
-                    st.caption(f"{file_info['size']}")
-                except Exception as e:
-                    logger.warning(f"获取文件信息失败: {file.name} | 错误: {str(e)}")
-                    st.caption("未知大小")
-
-            # 显示错误信息
-            if result["errors"]:
-                for error in result["errors"]:
-                    st.error(f"  • {error}")
-                    logger.debug(f"显示文件错误: {file.name} | {error}")
-
-            # 显示警告信息
-            if result["warnings"]:
-                for warning in result["warnings"]:
-                    st.warning(f"  • {warning}")
-                    logger.debug(f"显示文件警告: {file.name} | {warning}")
+            try:
+                file_info = file_infos.get(id(file)) or self.file_validator.get_file_info(file)
+                size = file_info["size"]
+            except Exception as e:
+                logger.warning("获取文件信息失败: {} | 错误: {}", file.name, e)
+                size = "未知大小"
+
+            names.append(f"📄 {file.name}")
+            statuses.append("✅" if result["valid"] else "❌")
+            sizes.append(size)
+            messages.append("; ".join([*result["errors"], *(f"⚠️ {w}" for w in result["warnings"])]))
+
+        status_df = pl.DataFrame(
+            {"文件": names, "状态": statuses, "大小": sizes, "错误": messages},
+            schema={"文件": pl.Utf8, "状态": pl.Utf8, "大小": pl.Utf8, "错误": pl.Utf8},
+        )
+        st.dataframe(status_df, use_container_width=True, hide_index=True)
@@ -23,19 +23,26 @@ class Container:
         self._singletons = {}
         logger.debug("依赖注入容器初始化完成")
 
-    def register(self, name: str, service_class, singleton: bool = False) -> None:
+    def register(self, name: str, service_class, singleton: bool = False, eager: bool = False) -> None:
         """注册服务
 
         Args:
             name: 服务名称
             service_class: 服务类
             singleton: 是否为单例模式
+            eager: 单例服务是否在注册时立即实例化
         """
         self._services[name] = (service_class, singleton)
+        # 重新注册时丢弃旧的单例实例
+        self._singletons.pop(name, None)
         logger.debug(
             f"服务注册: {name} | 类型: {service_class.__name__ if hasattr(service_class, '__name__') else str(service_class)} | 单例: {singleton}"
         )
 
+        if singleton and eager:
+            self._singletons[name] = service_class()
+            logger.debug(f"创建单例服务实例: {name}")
+
     def get(self, name: str) -> Any:
         """获取服务实例
 
@@ -48,6 +55,11 @@ class Container:
         Raises:
             ValueError: 当服务未注册时
         """
+        # 快速路径：已创建的单例直接返回
+        instance = self._singletons.get(name)
+        if instance is not None:
+            return instance
+
         if name not in self._services:
             error_msg = f"服务未注册: {name}"
             logger.error(error_msg)
@@ -57,12 +69,9 @@ class Container:
 
         try:
             if is_singleton:
-                if name not in self._singletons:
-                    logger.debug(f"创建单例服务实例: {name}")
-                    self._singletons[name] = service_class()
-                else:
-                    logger.debug(f"获取已存在的单例服务: {name}")
-                return self._singletons[name]
+                logger.debug(f"创建单例服务实例: {name}")
+                instance = self._singletons[name] = service_class()
+                return instance
 
             logger.debug(f"创建新的服务实例: {name}")
             return service_class()
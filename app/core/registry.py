@@ -19,6 +19,9 @@ class AppRegistry:
     def __init__(self):
         """初始化注册器"""
         self._apps = {}
+        self._descriptions = {}
+        # 可用应用列表的缓存，注册或注销应用时失效
+        self._available_apps: dict | None = None
         logger.debug("应用注册器初始化完成")
 
     def register_app(self, app_class: type[BaseApp]) -> None:
@@ -30,7 +33,11 @@ class AppRegistry:
         try:
             app_instance = app_class()
             app_name = app_instance.get_name()
+            # 注册时缓存应用描述，避免获取应用列表时重复实例化
+            app_description = app_instance.get_description()
             self._apps[app_name] = app_class
+            self._descriptions[app_name] = app_description
+            self._available_apps = None
             logger.info(f"应用注册成功: {app_name} | 类: {app_class.__name__}")
         except Exception as e:
             logger.exception(f"应用注册失败: {app_class.__name__} | 错误: {str(e)}")
@@ -39,17 +46,15 @@ class AppRegistry:
     def get_available_apps(self) -> dict:
         """获取可用应用列表
 
+        每次重新运行都会多次调用，结果缓存到应用注册或注销为止，调用方不应修改返回的字典
+
         Returns:
             应用名称到描述的映射字典
         """
-        logger.debug(f"获取可用应用列表，共 {len(self._apps)} 个应用")
-        try:
-            apps_info = {name: cls().get_description() for name, cls in self._apps.items()}
-            logger.debug(f"应用信息获取成功: {list(apps_info.keys())}")
-            return apps_info
-        except Exception as e:
-            logger.exception(f"获取应用信息失败: {str(e)}")
-            return {}
+        if self._available_apps is None:
+            self._available_apps = dict(self._descriptions)
+            logger.debug("生成可用应用列表，共 {} 个应用", len(self._available_apps))
+        return self._available_apps
 
     def load_app(self, name: str) -> BaseApp:
         """加载应用实例
@@ -113,6 +118,8 @@ class AppRegistry:
         """
         if name in self._apps:
             del self._apps[name]
+            self._descriptions.pop(name, None)
+            self._available_apps = None
             logger.info(f"应用注销成功: {name}")
             return True
         else:
@@ -6,9 +6,60 @@
 @Docs: 数据处理器
 """
 
+import string
+from functools import lru_cache
+
 import polars as pl
 
-from app.utils.logger import log_function_calls, logger
+from app.utils.logger import is_log_enabled, log_function_calls, logger
+
+# ASCII列名的标准化转换表：大写转小写、空格转下划线，一次 translate 完成
+_ASCII_STANDARDIZE_TABLE = str.maketrans({" ": "_", **{c: c.lower() for c in string.ascii_uppercase}})
+
+
+def _standardize_column_name(col: str) -> str:
+    """标准化单个列名
+
+    Args:
+        col: 原始列名
+
+    Returns:
+        去除首尾空格、转换为小写并将空格替换为下划线后的列名
+    """
+    if col.isascii():
+        return col.strip().translate(_ASCII_STANDARDIZE_TABLE)
+    # 非ASCII列名（如中文）的大小写规则需要完整的 lower
+    return col.strip().lower().replace(" ", "_")
+
+
+@lru_cache(maxsize=128)
+def _standardized_column_mapping(columns: tuple[str, ...]) -> dict[str, str] | None:
+    """计算列名标准化映射（按列名元组缓存）
+
+    Args:
+        columns: 原始列名元组
+
+    Returns:
+        需要变更的列名映射，无需变更时返回None
+    """
+    # 去除空格，转换为小写
+    mapping = {col: _standardize_column_name(col) for col in columns}
+    changed = {old: new for old, new in mapping.items() if old != new}
+    return changed or None
+
+
+def _column_names(frame: pl.DataFrame | pl.LazyFrame) -> list[str]:
+    """获取DataFrame或LazyFrame的列名
+
+    Args:
+        frame: DataFrame或LazyFrame
+
+    Returns:
+        列名列表
+    """
+    if isinstance(frame, pl.LazyFrame):
+        return frame.collect_schema().names()
+    return frame.columns
 
 
 class DataProcessor:
@@ -23,17 +74,17 @@ class DataProcessor:
         logger.info("数据处理器初始化完成")
 
     @log_function_calls(include_result=True)
-    def merge_dataframes(self, dfs: list[pl.DataFrame]) -> pl.DataFrame:
+    def merge_dataframes(self, dfs: list[pl.DataFrame | pl.LazyFrame]) -> pl.DataFrame | pl.LazyFrame:
         """合并多个DataFrame
 
         当前策略: 基于共同列进行纵向合并(concat)
         未来可扩展: 支持基于key的横向合并(join)等多种策略
 
         Args:
-            dfs: DataFrame列表
+            dfs: DataFrame列表，包含LazyFrame时不收集结果
 
         Returns:
-            合并后的DataFrame
+            合并后的DataFrame；输入包含LazyFrame时返回LazyFrame，可与后续清理、去重步骤一起收集
 
         Raises:
             ValueError: 没有数据可合并时
@@ -50,21 +101,44 @@ class DataProcessor:
             return dfs[0]
 
         try:
-            # 获取共同列
-            common_columns = self.get_common_columns(dfs)
+            # 标准化列名，列名已是标准形式时跳过重命名
+            standardized_dfs = []
+            standardized_columns = []
+            for df in dfs:
+                columns = tuple(_column_names(df))
+                column_mapping = _standardized_column_mapping(columns)
+                if column_mapping:
+                    standardized_dfs.append(df.rename(column_mapping))
+                    standardized_columns.append(tuple(column_mapping.get(col, col) for col in columns))
+                else:
+                    standardized_dfs.append(df)
+                    standardized_columns.append(columns)
+
+            is_lazy = any(isinstance(df, pl.LazyFrame) for df in dfs)
+
+            # 所有DataFrame列结构完全一致时直接合并，无需计算共同列和逐个投影
+            first_columns = standardized_columns[0]
+            if all(columns == first_columns for columns in standardized_columns[1:]):
+                logger.info(f"所有DataFrame列结构一致，直接合并 | 列数: {len(first_columns)}")
+                if is_lazy:
+                    return pl.concat([df.lazy() for df in standardized_dfs], how="vertical", rechunk=False)
+
+                merged_df = pl.concat(standardized_dfs, how="vertical", rechunk=False)
+                logger.info(f"数据合并完成 | 合并后行数: {len(merged_df)} | 列数: {len(merged_df.columns)}")
+                return merged_df
+
+            # 基于标准化后的列名获取共同列
+            common_columns = self.get_common_columns(standardized_dfs)
             logger.info(f"共同列数量: {len(common_columns)} | 列名: {common_columns}")
 
-            # 标准化列名并合并
-            standardized_dfs = []
-            for i, df in enumerate(dfs):
-                logger.debug(f"标准化DataFrame {i + 1}/{len(dfs)} | 原始列数: {len(df.columns)}")
-                std_df = self.standardize_columns(df)
-                # 只保留共同列
-                std_df = std_df.select(common_columns)
-                standardized_dfs.append(std_df)
-                logger.debug(f"DataFrame {i + 1} 标准化完成 | 保留列数: {len(std_df.columns)}")
-
-            merged_df = pl.concat(standardized_dfs)
+            # 以惰性查询投影共同列并合并，不生成中间DataFrame，也不在合并后重新整理内存块
+            lazy_frames = [std_df.lazy().select(common_columns) for std_df in standardized_dfs]
+            merged_lazy = pl.concat(lazy_frames, how="vertical", rechunk=False)
+            if is_lazy:
+                logger.info(f"数据合并查询构建完成 | 列数: {len(common_columns)}")
+                return merged_lazy
+
+            merged_df = merged_lazy.collect(engine="streaming")
             logger.info(f"数据合并完成 | 合并后行数: {len(merged_df)} | 列数: {len(merged_df.columns)}")
             return merged_df
 
@@ -73,11 +147,11 @@ class DataProcessor:
             raise
 
     @log_function_calls(include_result=True)
-    def get_common_columns(self, dfs: list[pl.DataFrame]) -> list[str]:
+    def get_common_columns(self, dfs: list[pl.DataFrame | pl.LazyFrame]) -> list[str]:
         """获取共同列
 
         Args:
-            dfs: DataFrame列表
+            dfs: DataFrame或LazyFrame列表
 
         Returns:
             共同列名列表
@@ -88,40 +162,37 @@ class DataProcessor:
 
         logger.debug(f"计算共同列 | DataFrame数量: {len(dfs)}")
 
-        common_cols = set(dfs[0].columns)
-        original_count = len(common_cols)
-
-        for i, df in enumerate(dfs[1:], 1):
-            common_cols &= set(df.columns)
-            logger.debug(f"与DataFrame {i + 1} 比较后，共同列数量: {len(common_cols)}")
+        # 按第一个DataFrame的列顺序保留共同列，合并时投影无需重新排列列
+        first_columns = _column_names(dfs[0])
+        original_count = len(first_columns)
+        other_columns = [set(_column_names(df)) for df in dfs[1:]]
 
-        result = list(common_cols)
+        result = [col for col in first_columns if all(col in columns for columns in other_columns)]
         logger.info(f"共同列计算完成 | 原始列数: {original_count} | 共同列数: {len(result)}")
         return result
 
     @log_function_calls(include_result=True)
-    def standardize_columns(self, df: pl.DataFrame) -> pl.DataFrame:
+    def standardize_columns(self, df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
         """标准化列名
 
         Args:
-            df: 待标准化的DataFrame
+            df: 待标准化的DataFrame或LazyFrame
 
         Returns:
-            标准化后的DataFrame
+            标准化后的DataFrame，输入为LazyFrame时返回LazyFrame
         """
-        logger.debug(f"开始标准化列名 | 原始列数: {len(df.columns)}")
+        columns = _column_names(df)
+        logger.debug(f"开始标准化列名 | 原始列数: {len(columns)}")
 
-        # 去除空格，转换为小写
-        column_mapping = {col: col.strip().lower().replace(" ", "_") for col in df.columns}
+        column_mapping = _standardized_column_mapping(tuple(columns))
+        if not column_mapping:
+            logger.debug("列名无需变更")
+            return df
 
-        # 记录列名变化
-        changed_columns = [(old, new) for old, new in column_mapping.items() if old != new]
-        if changed_columns:
-            logger.debug(f"列名标准化变更 | 变更数量: {len(changed_columns)}")
-            for old, new in changed_columns:
+        logger.debug(f"列名标准化变更 | 变更数量: {len(column_mapping)}")
+        if is_log_enabled("DEBUG"):
+            for old, new in column_mapping.items():
                 logger.debug(f"列名变更: '{old}' -> '{new}'")
-        else:
-            logger.debug("列名无需变更")
 
         result = df.rename(column_mapping)
         logger.debug("列名标准化完成")
@@ -140,22 +211,18 @@ class DataProcessor:
         logger.info(f"开始数据质量验证 | 行数: {len(df)} | 列数: {len(df.columns)}")
 
         try:
+            # null_count() 返回单行DataFrame，按行取出即为列名到空值数的映射，总数在Polars内部求和
+            nulls_row = df.null_count()
             validation_result = {
                 "row_count": len(df),
                 "column_count": len(df.columns),
-                "null_counts": df.null_count().to_dict(),
-                "data_types": {col: str(dtype) for col, dtype in zip(df.columns, df.dtypes, strict=False)},
+                "null_counts": nulls_row.row(0, named=True) if df.width > 0 else {},
+                "data_types": {col: str(dtype) for col, dtype in df.schema.items()},
                 "memory_usage": df.estimated_size(),
             }
 
             # 统计空值情况
-            null_counts_dict = validation_result["null_counts"]
-            if isinstance(null_counts_dict, dict):
-                null_counts = list(null_counts_dict.values())
-            else:
-                # 如果不是字典，尝试转换为列表
-                null_counts = list(null_counts_dict) if hasattr(null_counts_dict, "__iter__") else [0]
-            total_nulls = sum(null_counts)
+            total_nulls = int(nulls_row.select(pl.sum_horizontal(pl.all())).item()) if df.width > 0 else 0
             null_percentage = (total_nulls / (len(df) * len(df.columns))) * 100 if len(df) > 0 else 0
 
             logger.info(
@@ -168,20 +235,33 @@ class DataProcessor:
             raise
 
     @log_function_calls(include_result=True)
-    def deduplicate(self, df: pl.DataFrame) -> pl.DataFrame:
+    def deduplicate(
+        self,
+        df: pl.DataFrame | pl.LazyFrame,
+        subset: list[str] | None = None,
+        keep: str = "first",
+        maintain_order: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
         """去重
 
         Args:
-            df: 待去重的DataFrame
+            df: 待去重的DataFrame或LazyFrame
+            subset: 判断重复时使用的列，为None时使用所有列
+            keep: 保留重复行中的哪一行（first / last / any / none）
+            maintain_order: 是否保持原有行顺序，保持顺序会更慢
 
         Returns:
-            去重后的DataFrame
+            去重后的DataFrame，输入为LazyFrame时返回未收集的LazyFrame
         """
+        if isinstance(df, pl.LazyFrame):
+            logger.info("构建去重查询")
+            return df.unique(subset=subset, keep=keep, maintain_order=maintain_order)
+
         original_count = len(df)
-        logger.info(f"开始去重处理 | 原始行数: {original_count}")
+        logger.info(f"开始去重处理 | 原始行数: {original_count} | 去重列: {subset or '全部列'}")
 
         try:
-            result = df.unique()
+            result = df.unique(subset=subset, keep=keep, maintain_order=maintain_order)
             final_count = len(result)
             removed_count = original_count - final_count
 
@@ -193,36 +273,33 @@ class DataProcessor:
             raise
 
     @log_function_calls(include_result=True)
-    def clean_data(self, df: pl.DataFrame) -> pl.DataFrame:
+    def clean_data(self, df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
         """数据清理
 
         Args:
-            df: 待清理的DataFrame
+            df: 待清理的DataFrame或LazyFrame
 
         Returns:
-            清理后的DataFrame
+            清理后的DataFrame，输入为LazyFrame时返回未收集的LazyFrame
         """
+        # 移除全空行与字符串列去除前后空格合并为一个惰性查询，数据只扫描一遍
+        cleaned_lazy = (
+            df.lazy().filter(~pl.all_horizontal(pl.all().is_null())).with_columns(pl.col(pl.String).str.strip_chars())
+        )
+        if isinstance(df, pl.LazyFrame):
+            logger.info("构建数据清理查询")
+            return cleaned_lazy
+
         original_count = len(df)
         logger.info(f"开始数据清理 | 原始行数: {original_count}")
 
         try:
-            # 移除全空行
-            df_cleaned = df.filter(~pl.all_horizontal(pl.all().is_null()))
+            df_cleaned = cleaned_lazy.collect(engine="streaming")
             empty_rows_removed = original_count - len(df_cleaned)
 
             if empty_rows_removed > 0:
                 logger.info(f"移除空行: {empty_rows_removed} 行")
 
-            # 字符串列去除前后空格
-            string_cols = [
-                col for col, dtype in zip(df_cleaned.columns, df_cleaned.dtypes, strict=False) if dtype == pl.Utf8
-            ]
-            logger.debug(f"检测到字符串列: {len(string_cols)} 个 | 列名: {string_cols}")
-
-            for col in string_cols:
-                df_cleaned = df_cleaned.with_columns(pl.col(col).str.strip_chars())
-                logger.debug(f"字符串列清理完成: {col}")
-
             final_count = len(df_cleaned)
             logger.info(f"数据清理完成 | 清理后行数: {final_count} | 总共移除: {original_count - final_count} 行")
             return df_cleaned
@@ -265,10 +342,11 @@ class DataProcessor:
         try:
             # 验证所有DataFrame字段是否一致
             first_columns = dfs[0].columns
+            first_tuple = tuple(first_columns)
             logger.info(f"参考列结构 | 列数: {len(first_columns)}")
 
             for i, df in enumerate(dfs[1:], 1):
-                if df.columns != first_columns:
+                if tuple(df.columns) != first_tuple:
                     # 详细报告字段差异
                     missing_in_current = set(first_columns) - set(df.columns)
                     extra_in_current = set(df.columns) - set(first_columns)
@@ -287,28 +365,28 @@ class DataProcessor:
 
             # 为每个DataFrame添加来源列并合并
             dfs_with_source = []
-            total_rows = 0
+            source_rows: dict[str, int] = {}
+
+            # 来源列使用枚举类型，每行只存储来源编号，合并后无需重复存储文件名字符串
+            source_dtype = pl.Enum(list(dict.fromkeys(source_names)))
 
             for i, (df, source_name) in enumerate(zip(dfs, source_names, strict=False)):
                 # 添加来源列
-                df_with_source = df.with_columns(pl.lit(source_name).alias(source_column_name))
+                df_with_source = df.with_columns(pl.lit(source_name, dtype=source_dtype).alias(source_column_name))
                 dfs_with_source.append(df_with_source)
 
-                rows_count = len(df)
-                total_rows += rows_count
+                rows_count = df.height
+                source_rows[source_name] = source_rows.get(source_name, 0) + rows_count
                 logger.debug(f"处理文件 {i + 1}/{len(dfs)} | 来源: {source_name} | 行数: {rows_count}")
 
-            # 直接合并，不进行任何列名处理
-            merged_df = pl.concat(dfs_with_source)
-
-            # 统计来源分布
-            source_stats = merged_df.group_by(source_column_name).len().sort("len", descending=True)
+            # 直接合并，不进行任何列名处理；后续直接导出，无需重新整理内存块
+            merged_df = pl.concat(dfs_with_source, how="vertical", rechunk=False)
             logger.info(f"合并完成 | 总行数: {len(merged_df)} | 总列数: {len(merged_df.columns)} (包含来源列)")
 
-            # 记录每个来源的数据量
-            for row in source_stats.iter_rows():
-                source, count = row
-                logger.info(f"来源统计 | {source}: {count} 行")
+            # 记录每个来源的数据量，行数在循环中已统计，无需再对合并结果分组聚合
+            if is_log_enabled("INFO"):
+                for source, count in sorted(source_rows.items(), key=lambda item: item[1], reverse=True):
+                    logger.info(f"来源统计 | {source}: {count} 行")
 
             return merged_df
 
@@ -316,29 +394,58 @@ class DataProcessor:
             logger.exception(f"一致字段数据合并失败: {str(e)}")
             raise
 
-    def get_column_statistics(self, df: pl.DataFrame) -> dict:
+    def get_column_statistics(self, df: pl.DataFrame, compute_unique: bool = False) -> dict:
         """获取列统计信息
 
         Args:
             df: 待分析的DataFrame
+            compute_unique: 是否计算唯一值数，需要对每列构建哈希集合，默认不计算
 
         Returns:
             列统计信息字典
         """
+        schema = df.schema
+        if not schema:
+            return {}
+
+        # 所有列的聚合表达式放在一个 select 中，由Polars一次并行计算
+        exprs = []
+        for col, dtype in schema.items():
+            exprs.append(pl.col(col).null_count().alias(f"{col}__nulls"))
+            if compute_unique:
+                exprs.append(pl.col(col).n_unique().alias(f"{col}__unique"))
+            if dtype.is_numeric():
+                exprs.extend(
+                    [
+                        pl.col(col).min().alias(f"{col}__min"),
+                        pl.col(col).max().alias(f"{col}__max"),
+                        pl.col(col).mean().alias(f"{col}__mean"),
+                        pl.col(col).median().alias(f"{col}__median"),
+                    ]
+                )
+        stats_row = df.select(exprs).row(0, named=True)
+
+        total_rows = df.height
         stats = {}
-        for col in df.columns:
-            col_data = df[col]
+        for col, dtype in schema.items():
+            null_count = stats_row[f"{col}__nulls"]
             stats[col] = {
-                "dtype": str(col_data.dtype),
-                "null_count": col_data.null_count(),
-                "unique_count": col_data.n_unique(),
-                "null_percentage": (col_data.null_count() / len(df)) * 100 if len(df) > 0 else 0,
+                "dtype": str(dtype),
+                "null_count": null_count,
+                "null_percentage": (null_count / total_rows) * 100 if total_rows > 0 else 0,
             }
+            if compute_unique:
+                stats[col]["unique_count"] = stats_row[f"{col}__unique"]
 
             # 对数值列添加更多统计信息
-            if col_data.dtype.is_numeric():
+            if dtype.is_numeric():
                 stats[col].update(
-                    {"min": col_data.min(), "max": col_data.max(), "mean": col_data.mean(), "median": col_data.median()}
+                    {
+                        "min": stats_row[f"{col}__min"],
+                        "max": stats_row[f"{col}__max"],
+                        "mean": stats_row[f"{col}__mean"],
+                        "median": stats_row[f"{col}__median"],
+                    }
                 )
 
         return stats
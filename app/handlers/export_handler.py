@@ -10,8 +10,69 @@ from io import BytesIO
 from typing import Any
 
 import polars as pl
+import xlsxwriter
 
 from app.utils.logger import log_function_calls, logger
+from config.app_config import AppConfig
+
+# Excel 单个工作表的最大行数（包含表头）
+EXCEL_MAX_ROWS = 1_048_576
+
+# constant_memory 模式下各数据类型的数字格式，与 write_excel 的默认格式一致
+_XLSX_INTEGER_FORMAT = "#,##0;[Red]-#,##0"
+_XLSX_FLOAT_FORMAT = "#,##0.000;[Red]-#,##0.000"
+_XLSX_TEMPORAL_FORMATS = {pl.Date: "yyyy-mm-dd;@", pl.Datetime: "yyyy-mm-dd hh:mm:ss", pl.Time: "hh:mm:ss;@"}
+# 表头格式，与 write_excel 默认表格样式的表头外观一致
+_XLSX_HEADER_FORMAT = {"bold": True, "font_color": "#FFFFFF", "bg_color": "#4F81BD", "valign": "vcenter"}
+
+# 导出格式对应的MIME类型
+EXPORT_MIME_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _nested_to_str(value: Any) -> str:
+    """将嵌套类型的单元格值转换为字符串
+
+    Args:
+        value: List/Array 列的值为Series，Struct 列的值为字典
+
+    Returns:
+        与 write_excel 输出一致的字符串
+    """
+    return str(value.to_list() if isinstance(value, pl.Series) else value)
+
+
+def _xlsx_number_format(dtype: pl.DataType) -> str | None:
+    """获取数据类型对应的xlsx数字格式
+
+    Args:
+        dtype: Polars数据类型
+
+    Returns:
+        数字格式，无需格式时返回None
+    """
+    if dtype.is_integer():
+        return _XLSX_INTEGER_FORMAT
+    if dtype.is_float():
+        return _XLSX_FLOAT_FORMAT
+    return _XLSX_TEMPORAL_FORMATS.get(dtype.base_type())
+
+
+def _excel_serial(days: pl.Expr) -> pl.Expr:
+    """将距 1899-12-30 的天数转换为Excel日期序列值
+
+    Excel 把 1900 年视为闰年，1900-03-01 之前的日期序列值需要减一，与 xlsxwriter 的转换结果一致
+
+    Args:
+        days: 天数表达式
+
+    Returns:
+        Excel日期序列值表达式
+    """
+    return pl.when(days > 60).then(days).otherwise(days - 1)
 
 
 class ExportHandler:
@@ -22,12 +83,13 @@ class ExportHandler:
 
     def __init__(self):
         """初始化导出处理器"""
-        self.supported_formats = [".xlsx"]  # 简化为只支持xlsx以获得更好性能
+        # xlsx 需要逐个单元格生成XML，数据量大时可选择序列化更快的 csv / parquet
+        self.supported_formats = [".xlsx", ".csv", ".parquet"]
         logger.info(f"导出处理器初始化完成 | 支持格式: {', '.join(self.supported_formats)}")
 
     @log_function_calls(include_args=True)
     def export_excel(self, df: pl.DataFrame, columns: list[str] | None = None) -> bytes:
-        """使用Polars直接导出Excel格式，避免Pandas转换，提升性能
+        """直接从Polars数据导出Excel格式，避免Pandas转换，提升性能
 
         Args:
             df: 要导出的DataFrame
@@ -39,7 +101,71 @@ class ExportHandler:
         Raises:
             ValueError: 导出失败时
         """
-        logger.info(f"开始导出Excel | 原始行数: {len(df)} | 原始列数: {len(df.columns)}")
+        with BytesIO() as output:
+            self.export_to_buffer(df, output, columns, "xlsx")
+            return output.getvalue()
+
+    @log_function_calls(include_args=True)
+    def export_csv(self, df: pl.DataFrame, columns: list[str] | None = None) -> bytes:
+        """导出CSV格式
+
+        Args:
+            df: 要导出的DataFrame
+            columns: 要导出的列名列表，为None时导出所有列
+
+        Returns:
+            CSV文件的字节数据
+
+        Raises:
+            ValueError: 导出失败时
+        """
+        with BytesIO() as output:
+            self.export_to_buffer(df, output, columns, "csv")
+            return output.getvalue()
+
+    @log_function_calls(include_args=True)
+    def export_parquet(self, df: pl.DataFrame, columns: list[str] | None = None) -> bytes:
+        """导出Parquet格式
+
+        Args:
+            df: 要导出的DataFrame
+            columns: 要导出的列名列表，为None时导出所有列
+
+        Returns:
+            Parquet文件的字节数据
+
+        Raises:
+            ValueError: 导出失败时
+        """
+        with BytesIO() as output:
+            self.export_to_buffer(df, output, columns, "parquet")
+            return output.getvalue()
+
+    @log_function_calls()
+    def export_to_buffer(
+        self, df: pl.DataFrame, output: BytesIO, columns: list[str] | None = None, file_format: str = "xlsx"
+    ) -> int:
+        """按指定格式将数据写入调用方提供的字节流
+
+        Args:
+            df: 要导出的DataFrame
+            output: 写入目标字节流
+            columns: 要导出的列名列表，为None时导出所有列
+            file_format: 导出格式（xlsx / csv / parquet）
+
+        Returns:
+            写入的文件大小（字节）
+
+        Raises:
+            ValueError: 格式不支持或导出失败时
+        """
+        writers = {"xlsx": self._write_xlsx, "csv": self._write_csv, "parquet": self._write_parquet}
+        if file_format not in writers:
+            error_msg = f"不支持的导出格式: {file_format}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        logger.info(f"开始导出{file_format} | 原始行数: {len(df)} | 原始列数: {len(df.columns)}")
 
         try:
             if columns:
@@ -56,27 +182,120 @@ class ExportHandler:
                 df_to_export = df
                 logger.info("导出所有列")
 
-            # 创建字节流
-            output = BytesIO()
-
-            # 使用Polars写入Excel
-            df_to_export.write_excel(output)
-
-            # 获取字节数据
-            excel_data = output.getvalue()
-            file_size = len(excel_data)
+            writers[file_format](df_to_export, output)
+            file_size = output.getbuffer().nbytes
 
             logger.info(
-                f"Excel导出成功 | 导出行数: {len(df_to_export)} | 导出列数: {len(df_to_export.columns)} | 文件大小: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB)"
+                f"{file_format}导出成功 | 导出行数: {len(df_to_export)} | 导出列数: {len(df_to_export.columns)} | 文件大小: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB)"
             )
-            return excel_data
+            return file_size
 
         except Exception as e:
-            logger.exception(f"Excel导出失败: {str(e)}")
-            raise ValueError(f"导出Excel失败: {str(e)}") from e
+            logger.exception(f"{file_format}导出失败: {str(e)}")
+            raise ValueError(f"导出{file_format}失败: {str(e)}") from e
+
+    @staticmethod
+    def get_mime_type(file_format: str) -> str:
+        """获取导出格式对应的MIME类型
+
+        Args:
+            file_format: 导出格式
+
+        Returns:
+            MIME类型字符串
+        """
+        return EXPORT_MIME_TYPES.get(file_format, "application/octet-stream")
+
+    @staticmethod
+    def _write_xlsx(df: pl.DataFrame, output: BytesIO) -> None:
+        """写入xlsx
+
+        单元格数不超过 AppConfig.XLSX_CONSTANT_MEMORY_CELLS 时使用 Polars 自带的写入；
+        超过时改为 constant_memory 模式逐行写入，控制峰值内存
+
+        Args:
+            df: 要写入的DataFrame
+            output: 写入目标字节流
+        """
+        if df.height * df.width <= AppConfig.XLSX_CONSTANT_MEMORY_CELLS:
+            df.write_excel(output)
+        else:
+            ExportHandler._write_xlsx_constant_memory(df, output)
+
+    @staticmethod
+    def _write_xlsx_constant_memory(df: pl.DataFrame, output: BytesIO) -> None:
+        """以 constant_memory 模式逐行写入xlsx
+
+        xlsxwriter 在该模式下写完一行即刷新到临时文件，内存中只保留当前行，
+        峰值内存不再随工作簿大小增长。表头、数字格式与自动筛选与 write_excel 一致，
+        但该模式不支持表格对象，没有隔行底纹
+
+        Args:
+            df: 要写入的DataFrame
+            output: 写入目标字节流
+        """
+        if df.height + 1 > EXCEL_MAX_ROWS:
+            raise ValueError(f"数据行数 {df.height} 超过Excel单个工作表上限 {EXCEL_MAX_ROWS - 1} 行")
+
+        # 按原始数据类型确定列格式，再转换为可直接写入的值
+        number_formats = [_xlsx_number_format(dtype) for dtype in df.dtypes]
+        # 单元格只能写入标量，嵌套类型与 write_excel 一致转换为字符串；
+        # 日期时间在Polars中批量转换为Excel序列值，避免逐个单元格转换
+        df = df.with_columns(
+            pl.col(pl.List, pl.Array, pl.Struct).map_elements(_nested_to_str, return_dtype=pl.String),
+            _excel_serial(pl.col(pl.Date).cast(pl.Int32) + 25569),
+            _excel_serial(pl.col(pl.Datetime).dt.replace_time_zone(None).dt.epoch("ms").truediv(86_400_000) + 25569),
+            pl.col(pl.Time).cast(pl.Int64).truediv(86_400_000_000_000),
+        )
+
+        workbook = xlsxwriter.Workbook(
+            output,
+            {
+                "constant_memory": True,
+                "use_zip64": True,
+                "nan_inf_to_errors": True,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+            },
+        )
+        try:
+            worksheet = workbook.add_worksheet("Sheet1")
+
+            # 列格式作用于该列未单独指定格式的单元格，逐行写入时无需为每个单元格传入格式
+            for col_index, number_format in enumerate(number_formats):
+                column_format = {"valign": "vcenter"}
+                if number_format:
+                    column_format["num_format"] = number_format
+                worksheet.set_column(col_index, col_index, None, workbook.add_format(column_format))
+
+            worksheet.write_row(0, 0, df.columns, workbook.add_format(_XLSX_HEADER_FORMAT))
+            for row_index, row in enumerate(df.iter_rows(), 1):
+                worksheet.write_row(row_index, 0, row)
+
+            if df.width > 0:
+                worksheet.autofilter(0, 0, df.height, df.width - 1)
         finally:
-            if "output" in locals():
-                output.close()
+            workbook.close()
+
+    @staticmethod
+    def _write_csv(df: pl.DataFrame, output: BytesIO) -> None:
+        """写入CSV，由Polars在Rust侧批量格式化
+
+        Args:
+            df: 要写入的DataFrame
+            output: 写入目标字节流
+        """
+        df.write_csv(output, batch_size=65536)
+
+    @staticmethod
+    def _write_parquet(df: pl.DataFrame, output: BytesIO) -> None:
+        """写入Parquet，列式存储并使用snappy压缩
+
+        Args:
+            df: 要写入的DataFrame
+            output: 写入目标字节流
+        """
+        df.write_parquet(output, compression="snappy", statistics=False, row_group_size=1_000_000)
 
     @log_function_calls()
     def get_export_summary(self, df: pl.DataFrame, selected_columns: list[str] | None = None) -> dict[str, Any]:
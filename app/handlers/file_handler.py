@@ -6,10 +6,19 @@
 @Docs: 文件处理器
 """
 
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import fastexcel
 import polars as pl
 
 from app.utils.logger import log_function_calls, logger
 
+# Polars 2.0 起 read_csv 不再合并内存块并移除了 rechunk 参数，旧版本需显式关闭
+_CSV_RECHUNK_OPTIONS = {"rechunk": False} if int(pl.__version__.split(".", 1)[0]) < 2 else {}
+
 
 class FileHandler:
     """文件处理器
@@ -20,6 +29,7 @@ class FileHandler:
     def __init__(self):
         """初始化文件处理器"""
         self.supported_formats = [".csv", ".xlsx", ".xls"]
+        self._formats_set = frozenset(self.supported_formats)
         logger.info(f"文件处理器初始化完成 | 支持格式: {', '.join(self.supported_formats)}")
 
     @log_function_calls(include_args=True)
@@ -38,10 +48,10 @@ class FileHandler:
         filename = file.name.lower()
         logger.debug(f"检测文件类型: {filename}")
 
-        for fmt in self.supported_formats:
-            if filename.endswith(fmt):
-                logger.debug(f"文件类型检测成功: {filename} -> {fmt}")
-                return fmt
+        ext = os.path.splitext(filename)[1]
+        if ext in self._formats_set:
+            logger.debug(f"文件类型检测成功: {filename} -> {ext}")
+            return ext
 
         error_msg = f"不支持的文件格式: {filename}"
         logger.error(error_msg)
@@ -64,7 +74,15 @@ class FileHandler:
         logger.info(f"开始读取CSV文件: {filename}")
 
         try:
-            df = pl.read_csv(file)
+            # 读取后会与其他文件合并，无需在此重新整理内存块；类型推断只参考前1000行
+            df = pl.read_csv(
+                file,
+                low_memory=True,
+                infer_schema_length=1000,
+                try_parse_dates=False,
+                use_pyarrow=False,
+                **_CSV_RECHUNK_OPTIONS,
+            )
             logger.info(f"CSV文件读取成功: {filename} | 行数: {len(df)} | 列数: {len(df.columns)}")
             return df
         except Exception as e:
@@ -89,8 +107,8 @@ class FileHandler:
         logger.info(f"开始读取Excel文件: {filename}")
 
         try:
-            # 读取所有工作表
-            excel_data = pl.read_excel(file, sheet_id=None)
+            # 读取所有工作表，calamine 引擎由 Rust 直接解析，无需转换为CSV
+            excel_data = pl.read_excel(file, sheet_id=None, engine="calamine")
 
             if isinstance(excel_data, dict):
                 dataframes = list(excel_data.values())
@@ -112,6 +130,45 @@ class FileHandler:
             logger.exception(error_msg)
             raise ValueError(f"Error reading Excel file: {str(e)}") from e
 
+    @log_function_calls(include_result=True)
+    def peek_excel(self, file) -> list[dict]:
+        """获取Excel各工作表的尺寸，不解析单元格数据
+
+        Args:
+            file: Excel文件对象
+
+        Returns:
+            工作表信息列表，包含工作表名、行数（不含表头）、列数
+
+        Raises:
+            ValueError: 读取失败时
+        """
+        filename = getattr(file, "name", "unknown")
+        logger.debug(f"读取Excel工作表尺寸: {filename}")
+
+        try:
+            if hasattr(file, "getvalue"):
+                source = file.getvalue()
+            elif hasattr(file, "read"):
+                file.seek(0)
+                source = file.read()
+                file.seek(0)
+            else:
+                source = file
+
+            reader = fastexcel.read_excel(source)
+            sheets = []
+            for idx, sheet_name in enumerate(reader.sheet_names):
+                # n_rows=0 只解析表头，total_height 为工作表的总数据行数
+                sheet = reader.load_sheet(idx, n_rows=0)
+                sheets.append({"name": sheet_name, "rows": sheet.total_height, "columns": sheet.width})
+            return sheets
+
+        except Exception as e:
+            error_msg = f"Excel工作表尺寸读取失败: {filename} | 错误: {str(e)}"
+            logger.exception(error_msg)
+            raise ValueError(f"Error reading Excel file: {str(e)}") from e
+
     @log_function_calls(include_result=True)
     def read_file(self, file) -> list[pl.DataFrame]:
         """统一文件读取接口
@@ -126,6 +183,7 @@ class FileHandler:
             ValueError: 读取失败时
         """
         filename = getattr(file, "name", "unknown")
+
         logger.info(f"开始读取文件: {filename}")
 
         try:
@@ -149,6 +207,69 @@ class FileHandler:
             logger.exception(f"文件读取失败: {filename}")
             raise
 
+    @log_function_calls()
+    def scan_file(self, file) -> list[pl.LazyFrame]:
+        """惰性读取文件
+
+        CSV使用 scan_csv，过滤、投影等后续操作可下推到读取阶段，最终只收集一次；
+        Excel没有惰性读取接口，读取后转换为LazyFrame
+
+        Args:
+            file: 文件对象
+
+        Returns:
+            LazyFrame列表
+
+        Raises:
+            ValueError: 读取失败时
+        """
+        filename = getattr(file, "name", "unknown")
+        file_type = self.detect_file_type(file)
+        logger.info(f"开始惰性读取文件: {filename}")
+
+        if file_type == ".csv":
+            try:
+                if hasattr(file, "seek"):
+                    file.seek(0)
+                return [pl.scan_csv(file, low_memory=True, infer_schema_length=1000, try_parse_dates=False)]
+            except Exception as e:
+                error_msg = f"CSV文件读取失败: {filename} | 错误: {str(e)}"
+                logger.exception(error_msg)
+                raise ValueError(f"Error reading CSV file: {str(e)}") from e
+
+        return [df.lazy() for df in self.read_file(file)]
+
+    @log_function_calls()
+    def read_files(self, files: list, loader: Callable[[Any], Any] | None = None) -> list:
+        """并行读取多个文件
+
+        Polars 与 calamine 解析时会释放GIL，多个文件在线程池中并行读取；
+        单个文件读取失败不影响其他文件
+
+        Args:
+            files: 文件对象列表
+            loader: 读取单个文件的函数，为None时使用 read_file
+
+        Returns:
+            与文件顺序一致的读取结果列表，读取失败的文件对应位置为其异常对象
+        """
+        loader = loader or self.read_file
+
+        def load(file) -> Any:
+            try:
+                return loader(file)
+            except Exception as e:
+                return e
+
+        if len(files) <= 1:
+            return [load(file) for file in files]
+
+        max_workers = min(len(files), os.cpu_count() or 1)
+        logger.info(f"开始并行读取文件 | 文件数量: {len(files)} | 线程数: {max_workers}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(load, files))
+
     @log_function_calls()
     def get_file_summary(self, file) -> dict:
         """获取文件摘要信息
@@ -163,21 +284,32 @@ class FileHandler:
         logger.debug(f"获取文件摘要: {filename}")
 
         try:
-            dataframes = self.read_file(file)
-            total_rows = sum(len(df) for df in dataframes)
-            total_columns = sum(len(df.columns) for df in dataframes)
+            file_type = self.detect_file_type(file)
+
+            if file_type in [".xlsx", ".xls"]:
+                # Excel只读取工作表尺寸，无需解析单元格；read_excel 只读取第一个工作表，摘要与之保持一致
+                sheets = self.peek_excel(file)[:1]
+                sheets_count = len(sheets)
+                total_rows = sum(sheet["rows"] for sheet in sheets)
+                total_columns = sum(sheet["columns"] for sheet in sheets)
+            else:
+                # CSV惰性读取，只统计行数和表头，不生成完整的DataFrame
+                lazy_frames = self.scan_file(file)
+                sheets_count = len(lazy_frames)
+                total_rows = sum(lf.select(pl.len()).collect().item() for lf in lazy_frames)
+                total_columns = sum(lf.collect_schema().len() for lf in lazy_frames)
 
             summary = {
                 "file_name": filename,
-                "file_type": self.detect_file_type(file),
-                "sheets_count": len(dataframes),
+                "file_type": file_type,
+                "sheets_count": sheets_count,
                 "total_rows": total_rows,
                 "total_columns": total_columns,
                 "success": True,
             }
 
             logger.info(
-                f"文件摘要生成成功: {filename} | 工作表: {len(dataframes)} | 行: {total_rows} | 列: {total_columns}"
+                f"文件摘要生成成功: {filename} | 工作表: {sheets_count} | 行: {total_rows} | 列: {total_columns}"
             )
             return summary
 
@@ -6,8 +6,13 @@
 @Docs: 数据合并应用
 """
 
+import hashlib
+from io import BytesIO
+from typing import Any
+
 import polars as pl
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from app.base.base_app import BaseApp
 from app.components.column_selector import ColumnSelector
@@ -15,11 +20,69 @@ from app.components.data_preview import DataPreview
 from app.components.error_handler import ErrorHandler
 from app.components.export_panel import ExportPanel
 from app.components.file_uploader import FileUploader
+from app.core.service_manager import ServiceManager
 from app.handlers.data_processor import DataProcessor
 from app.handlers.file_handler import FileHandler
 from app.state.session_manager import SessionManager
 from app.utils.file_validator import FileValidator
 from app.utils.logger import log_function_calls, logger
+from config.app_config import AppConfig
+
+# 合并结果对应的上传文件标识在会话状态中的键名
+PROCESSED_DATA_KEY = "processed_data_key"
+
+
+# 应用使用的服务名称
+_SERVICE_NAMES = ("file_validator", "file_uploader", "file_handler", "data_processor")
+
+
+def _resolve_services() -> dict[str, Any]:
+    """解析应用使用的服务
+
+    优先从全局服务管理器获取；服务管理器尚未初始化时（如编排器注册应用时）创建本地实例。
+    结果不做跨运行缓存，服务实例的生命周期由依赖注入容器决定
+
+    Returns:
+        服务名称到服务实例的映射
+    """
+    if ServiceManager.is_initialized():
+        try:
+            services = {name: ServiceManager.get_service(name) for name in _SERVICE_NAMES}
+            logger.debug("使用全局服务管理器获取服务")
+            return services
+        except ValueError as e:
+            logger.warning(f"全局服务获取失败: {str(e)}")
+
+    # 兜底：创建本地服务实例
+    logger.warning("全局服务管理器不可用，创建本地服务实例")
+    file_validator = FileValidator()
+    return {
+        "file_validator": file_validator,
+        "file_uploader": FileUploader(file_validator),
+        "file_handler": FileHandler(),
+        "data_processor": DataProcessor(),
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=AppConfig.CACHE_TTL)
+def _cached_read(file_hash: str, name: str, _file_handler: FileHandler, _file_bytes: bytes) -> list[pl.DataFrame]:
+    """读取文件（按文件内容哈希缓存）
+
+    上传文件读取结果唯一的缓存层，FileHandler.read_file 本身不缓存；
+    文件内容不参与 Streamlit 的缓存键计算，由调用方传入内容哈希
+
+    Args:
+        file_hash: 文件内容哈希
+        name: 文件名，用于判断文件类型
+        _file_handler: 文件处理器（不参与缓存键计算）
+        _file_bytes: 文件内容（不参与缓存键计算）
+
+    Returns:
+        DataFrame列表
+    """
+    buffer = BytesIO(_file_bytes)
+    buffer.name = name
+    return _file_handler.read_file(buffer)
 
 
 class MergeApp(BaseApp):
@@ -33,23 +96,11 @@ class MergeApp(BaseApp):
         """初始化应用"""
         logger.info("初始化数据合并应用")
 
-        # 使用全局服务管理器获取服务，如果不可用则创建本地实例
-        try:
-            from app.core.service_manager import ServiceManager
-
-            self.file_validator = ServiceManager.get_service("file_validator")
-            self.file_uploader = ServiceManager.get_service("file_uploader")
-            self.file_handler = ServiceManager.get_service("file_handler")
-            self.data_processor = ServiceManager.get_service("data_processor")
-            logger.debug("使用全局服务管理器获取服务")
-
-        except (RuntimeError, ValueError):
-            # 兜底：创建本地服务实例
-            logger.warning("全局服务管理器不可用，创建本地服务实例")
-            self.file_validator = FileValidator()
-            self.file_uploader = FileUploader(self.file_validator)
-            self.file_handler = FileHandler()
-            self.data_processor = DataProcessor()
+        services = _resolve_services()
+        self.file_validator = services["file_validator"]
+        self.file_uploader = services["file_uploader"]
+        self.file_handler = services["file_handler"]
+        self.data_processor = services["data_processor"]
 
         logger.info("数据合并应用初始化完成")
 
@@ -76,7 +127,6 @@ class MergeApp(BaseApp):
         )
         return is_valid
 
-    @log_function_calls()
     def render(self) -> None:
         """渲染应用界面"""
         logger.info("开始渲染数据合并应用界面")
@@ -101,7 +151,6 @@ class MergeApp(BaseApp):
 
         logger.debug("数据合并应用界面渲染完成")
 
-    @log_function_calls()
     def _render_file_upload_tab(self) -> None:
         """渲染文件上传标签页"""
         logger.debug("渲染文件上传标签页")
@@ -140,79 +189,201 @@ class MergeApp(BaseApp):
         logger.info(f"开始处理和合并文件 | 文件数量: {len(uploaded_files)}")
 
         try:
-            with st.spinner("正在读取和合并文件..."):
-                all_dataframes = []
-                source_names = []
-
-                # 读取每个文件并准备来源信息
-                for i, file in enumerate(uploaded_files):
-                    logger.debug(f"处理文件 {i + 1}/{len(uploaded_files)}: {file.name}")
-
-                    try:
-                        dfs = self.file_handler.read_file(file)
-
-                        # 提取文件名作为来源标识（去掉扩展名）
-                        import os
-
-                        source_name = os.path.splitext(file.name)[0]
-
-                        # 为每个工作表添加来源信息
-                        for j, df in enumerate(dfs):
-                            all_dataframes.append(df)
-                            # 如果有多个工作表，添加工作表标识
-                            if len(dfs) > 1:
-                                source_names.append(f"{source_name}_工作表{j + 1}")
-                            else:
-                                source_names.append(source_name)
-
-                        logger.debug(f"文件 {file.name} 读取成功，包含 {len(dfs)} 个数据表")
-
-                    except Exception as e:
-                        error_msg = f"文件 {file.name} 读取失败: {str(e)}"
-                        logger.error(error_msg)
-                        ErrorHandler.show_error(error_msg)
-                        continue
-
-                if not all_dataframes:
-                    error_msg = "没有成功读取任何数据"
-                    logger.error(error_msg)
-                    ErrorHandler.show_error(error_msg)
+            # 按文件内容哈希识别上传的文件，重新运行时文件未变化则直接复用合并结果
+            file_hashes = [hashlib.blake2b(file.getvalue(), digest_size=16).hexdigest() for file in uploaded_files]
+            files_id = "|".join(f"{h}:{file.name}" for h, file in zip(file_hashes, uploaded_files, strict=True))
+            files_hash = hashlib.blake2b(files_id.encode(), digest_size=16).hexdigest()
+            data_key = SessionManager.get_cache_key(SessionManager.CACHE_KEYS["processed_data"], file_hash=files_hash)
+
+            merged_data = SessionManager.get_state("processed_data")
+            if merged_data is None or SessionManager.get_state(PROCESSED_DATA_KEY) != data_key:
+                with st.spinner("正在读取和合并文件..."):
+                    merged_data = self._read_and_merge_files(uploaded_files, file_hashes)
+
+                if merged_data is None:
                     return
 
-                # 使用新的合并方法，专门处理字段一致的场景
-                logger.info(f"开始合并数据 | 总数据表数量: {len(all_dataframes)} | 来源数量: {len(source_names)}")
-                merged_data = self.data_processor.merge_identical_dataframes(all_dataframes, source_names)
-
                 # 保存到会话状态
                 SessionManager.set_state("processed_data", merged_data)
+                SessionManager.set_state(PROCESSED_DATA_KEY, data_key)
+            else:
+                logger.info("上传文件未变化，复用已合并的数据")
+
+            # 显示成功信息和来源统计
+            success_msg = (
+                f"文件处理完成！合并后数据: {len(merged_data)} 行 x {len(merged_data.columns)} 列（包含来源列）"
+            )
+            logger.info(success_msg)
+            ErrorHandler.show_success(success_msg)
+
+            # 显示来源统计信息
+            if "来源" in merged_data.columns:
+                stats_df = merged_data["来源"].value_counts(sort=True).rename({"来源": "来源文件", "count": "数据行数"})
+                st.subheader("📊 数据来源统计")
+                st.dataframe(stats_df, use_container_width=True)
+
+        except Exception as e:
+            error_msg = f"文件处理失败: {str(e)}"
+            logger.exception(error_msg)
+            ErrorHandler.show_error("文件处理失败", str(e))
+
+    def _load_file(self, file, file_hash: str) -> list[tuple[pl.LazyFrame, list[str]]]:
+        """读取单个文件并解析各数据表的列名，在线程池中执行
+
+        Args:
+            file: 上传的文件
+            file_hash: 文件内容哈希
+
+        Returns:
+            (LazyFrame, 列名列表) 元组的列表
+        """
+        if self.file_handler.detect_file_type(file) == ".csv":
+            # CSV惰性读取，合并时由流式引擎分批解析，不为每个文件单独生成完整的DataFrame
+            buffer = BytesIO(file.getvalue())
+            buffer.name = file.name
+            lfs = self.file_handler.scan_file(buffer)
+        else:
+            lfs = [df.lazy() for df in _cached_read(file_hash, file.name, self.file_handler, file.getvalue())]
 
-                # 显示成功信息和来源统计
-                success_msg = (
-                    f"文件处理完成！合并后数据: {len(merged_data)} 行 x {len(merged_data.columns)} 列（包含来源列）"
-                )
-                logger.info(success_msg)
-                ErrorHandler.show_success(success_msg)
+        # 在读取阶段解析表头，表头有误时归为该文件的读取错误
+        return [(lf, lf.collect_schema().names()) for lf in lfs]
 
-                # 显示来源统计信息
-                if "来源" in merged_data.columns:
-                    source_stats = merged_data.group_by("来源").len().sort("len", descending=True)
-                    st.subheader("📊 数据来源统计")
-                    stats_data = []
-                    for row in source_stats.iter_rows():
-                        source, count = row
-                        stats_data.append({"来源文件": source, "数据行数": count})
+    def _read_and_merge_files(self, uploaded_files: list, file_hashes: list[str]) -> pl.DataFrame | None:
+        """读取并合并文件
 
-                    import polars as pl
+        Args:
+            uploaded_files: 上传的文件列表
+            file_hashes: 与文件一一对应的内容哈希
 
-                    stats_df = pl.DataFrame(stats_data)
-                    st.dataframe(stats_df, use_container_width=True)
+        Returns:
+            合并后的DataFrame，没有成功读取任何数据时返回None
+        """
+        lazy_frames = []
+        frame_columns = []
+        frame_files = []
+        source_names = []
+
+        # 提取文件名作为来源标识（去掉扩展名）
+        stems = [file.name.rpartition(".")[0] or file.name for file in uploaded_files]
+
+        # 各文件并行读取，结果与上传顺序一致，保证来源名称顺序确定
+        ctx = get_script_run_ctx()
+
+        def load(item: tuple) -> list[tuple[pl.LazyFrame, list[str]]]:
+            # 工作线程绑定当前脚本运行上下文，读取缓存等 Streamlit 接口才能正常使用
+            add_script_run_ctx(None, ctx)
+            return self._load_file(*item)
+
+        results = self.file_handler.read_files(list(zip(uploaded_files, file_hashes, strict=True)), loader=load)
+
+        for i, (file, loaded) in enumerate(zip(uploaded_files, results, strict=True)):
+            logger.debug("处理文件 {}/{}: {}", i + 1, len(uploaded_files), file.name)
+
+            if isinstance(loaded, Exception):
+                error_msg = f"文件 {file.name} 读取失败: {str(loaded)}"
+                logger.error(error_msg)
+                ErrorHandler.show_error(error_msg)
+                continue
+
+            source_name = stems[i]
+
+            # 为每个工作表添加来源信息
+            for j, (lf, columns) in enumerate(loaded):
+                frame_columns.append(columns)
+                lazy_frames.append(lf)
+                frame_files.append(file.name)
+                # 如果有多个工作表，添加工作表标识
+                if len(loaded) > 1:
+                    source_names.append(f"{source_name}_工作表{j + 1}")
+                else:
+                    source_names.append(source_name)
+
+            logger.debug("文件 {} 读取成功，包含 {} 个数据表", file.name, len(loaded))
+
+        if not lazy_frames:
+            error_msg = "没有成功读取任何数据"
+            logger.error(error_msg)
+            ErrorHandler.show_error(error_msg)
+            return None
+
+        logger.info(f"开始合并数据 | 总数据表数量: {len(lazy_frames)} | 来源数量: {len(source_names)}")
+
+        first_columns = frame_columns[0]
+        if any(columns != first_columns for columns in frame_columns[1:]):
+            # 字段不一致时由数据处理器校验并给出详细的字段差异
+            dataframes, source_names = self._collect_each(lazy_frames, frame_files, source_names)
+            if not dataframes:
+                return None
+            return self.data_processor.merge_identical_dataframes(dataframes, source_names)
 
+        try:
+            merged_data = self._concat_with_source(lazy_frames, source_names)
         except Exception as e:
-            error_msg = f"文件处理失败: {str(e)}"
-            logger.exception(error_msg)
-            ErrorHandler.show_error("文件处理失败", str(e))
+            # 惰性读取的CSV在合并收集时才解析数据行，某个文件的数据有误时逐个收集，跳过并报告出错的文件
+            logger.warning("合并收集失败，逐个文件收集以定位出错的文件 | 错误: {}", e)
+            dataframes, source_names = self._collect_each(lazy_frames, frame_files, source_names)
+            if not dataframes:
+                return None
+            merged_data = self._concat_with_source([df.lazy() for df in dataframes], source_names)
+
+        logger.info(f"合并完成 | 总行数: {len(merged_data)} | 总列数: {len(merged_data.columns)} (包含来源列)")
+        return merged_data
+
+    @staticmethod
+    def _collect_each(
+        lazy_frames: list[pl.LazyFrame], frame_files: list[str], source_names: list[str]
+    ) -> tuple[list[pl.DataFrame], list[str]]:
+        """逐个收集数据表，收集失败的文件单独报告并跳过
+
+        Args:
+            lazy_frames: 各数据表的LazyFrame
+            frame_files: 各数据表所属的文件名
+            source_names: 各数据表的来源名称
+
+        Returns:
+            收集成功的DataFrame列表及其来源名称列表
+        """
+        dataframes = []
+        collected_names = []
+        for lf, file_name, source_name in zip(lazy_frames, frame_files, source_names, strict=True):
+            try:
+                dataframes.append(lf.collect())
+                collected_names.append(source_name)
+            except Exception as e:
+                error_msg = f"文件 {file_name} 读取失败: {str(e)}"
+                logger.error(error_msg)
+                ErrorHandler.show_error(error_msg)
+
+        if not dataframes:
+            error_msg = "没有成功读取任何数据"
+            logger.error(error_msg)
+            ErrorHandler.show_error(error_msg)
+
+        return dataframes, collected_names
+
+    @staticmethod
+    def _concat_with_source(lazy_frames: list[pl.LazyFrame], source_names: list[str]) -> pl.DataFrame:
+        """为字段一致的数据表附加来源列并合并
+
+        在惰性查询中附加来源列并一次性合并，只在最后收集一次；合并结果会被多次预览和导出，收集后统一整理内存块
+
+        Args:
+            lazy_frames: 各数据表的LazyFrame
+            source_names: 各数据表的来源名称
+
+        Returns:
+            合并后的DataFrame
+        """
+        source_dtype = pl.Enum(list(dict.fromkeys(source_names)))
+        frames = [
+            lf.with_columns(pl.lit(source_name, dtype=source_dtype).alias("来源"))
+            for lf, source_name in zip(lazy_frames, source_names, strict=True)
+        ]
+        if len(frames) == 1:
+            # 单个数据表无需合并，默认引擎收集时已读取的列不会被复制
+            return frames[0].collect().rechunk()
+        return pl.concat(frames, how="vertical_relaxed", rechunk=False).collect(engine="streaming").rechunk()
 
-    @log_function_calls()
     def _render_data_preview_tab(self) -> None:
         """渲染数据预览标签页"""
         logger.debug("渲染数据预览标签页")
@@ -241,7 +412,6 @@ class MergeApp(BaseApp):
         with st.expander("📊 字段详情", expanded=False):
             preview.render_column_info(processed_data)
 
-    @log_function_calls()
     def _render_column_selection_tab(self) -> None:
         """渲染字段选择标签页"""
         logger.debug("渲染字段选择标签页")
@@ -271,7 +441,6 @@ class MergeApp(BaseApp):
         else:
             logger.debug("用户未选择任何字段")
 
-    @log_function_calls()
     def _render_export_tab(self) -> None:
         """渲染导出标签页"""
         logger.debug("渲染导出标签页")
@@ -292,16 +461,5 @@ class MergeApp(BaseApp):
         logger.info(f"显示导出面板 | 数据行数: {len(processed_data)} | 选择字段数: {len(selected_columns)}")
 
         # 显示导出面板
-        try:
-            from app.core.service_manager import ServiceManager
-
-            _ = ServiceManager.get_service("export_handler")
-            logger.debug("使用全局服务获取导出处理器")
-        except (RuntimeError, ValueError):
-            from app.handlers.export_handler import ExportHandler
-
-            _ = ExportHandler()
-            logger.debug("创建本地导出处理器实例")
-
         export_panel = ExportPanel()
         export_panel.render(processed_data, selected_columns)
@@ -10,7 +10,7 @@ from typing import Any
 
 import streamlit as st
 
-from app.utils.logger import logger
+from app.utils.logger import is_log_enabled, logger
 
 
 class SessionManager:
@@ -28,26 +28,43 @@ class SessionManager:
         "processing_status": "processing_status",
     }
 
+    # 各状态版本号在会话状态中的键名
+    VERSIONS_KEY = "_versions"
+
+    # 应用管理的状态及其默认值
+    DEFAULT_STATES: dict[str, Any] = {
+        "current_app": None,
+        "uploaded_files": [],
+        "processed_data": None,
+        "selected_columns": [],
+        "processing_status": "idle",
+        "error_message": None,
+    }
+    _MANAGED_KEYS = frozenset(DEFAULT_STATES)
+
+    # 会话状态已初始化标记的键名
+    INITIALIZED_KEY = "_ss_initialized"
+
     @staticmethod
     def init_session_state() -> None:
-        """初始化会话状态"""
-        logger.debug("初始化会话状态")
+        """初始化会话状态
 
-        default_states: dict[str, Any] = {
-            "current_app": None,
-            "uploaded_files": [],
-            "processed_data": None,
-            "selected_columns": [],
-            "processing_status": "idle",
-            "error_message": None,
-        }
+        每次重新运行都会调用，已初始化时只检查一次标记即返回
+        """
+        if st.session_state.get(SessionManager.INITIALIZED_KEY):
+            return
+
+        logger.debug("初始化会话状态")
 
         initialized_count = 0
-        for key, value in default_states.items():
+        for key, value in SessionManager.DEFAULT_STATES.items():
             if key not in st.session_state:
-                st.session_state[key] = value
+                # 可变默认值复制一份，避免不同会话共享同一个列表
+                st.session_state[key] = value.copy() if isinstance(value, list) else value
                 initialized_count += 1
-                logger.debug(f"初始化状态: {key} = {value}")
+                logger.debug("初始化状态: {} = {}", key, value)
+
+        st.session_state[SessionManager.INITIALIZED_KEY] = True
 
         if initialized_count > 0:
             logger.info(f"会话状态初始化完成 | 新增状态数: {initialized_count}")
@@ -65,81 +82,54 @@ class SessionManager:
             状态值，不存在时返回None
         """
         value = st.session_state.get(key)
-        logger.debug(f"获取状态: {key} = {type(value).__name__}")
+        # 读取状态在每次重新运行时会被频繁调用，使用参数化日志，级别未启用时不格式化消息
+        logger.debug("获取状态: {} = {}", key, type(value).__name__)
         return value
 
     @staticmethod
     def set_state(key: str, value: Any) -> None:
         """设置状态值
 
+        只按对象标识判断是否变化，变化时递增该状态的版本号
+
         Args:
             key: 状态键名
             value: 状态值
         """
-        old_value = st.session_state.get(key)
+        values_changed = st.session_state.get(key) is not value
         st.session_state[key] = value
 
-        # 安全的值比较，处理DataFrame等特殊类型
-        values_changed = SessionManager._values_are_different(old_value, value)
-
         if values_changed:
-            logger.info(f"状态更新: {key} | 类型: {type(value).__name__}")
-            if hasattr(value, "shape") and hasattr(value, "columns"):
-                # DataFrame类型，记录更简洁的信息
-                logger.debug(f"状态详情: {key} | DataFrame形状: {getattr(value, 'shape', 'unknown')}")
-            else:
-                logger.debug(f"状态详情: {key} | 新值: {value}")
+            versions = st.session_state.setdefault(SessionManager.VERSIONS_KEY, {})
+            versions[key] = versions.get(key, 0) + 1
+            logger.info("状态更新: {} | 类型: {} | 版本: {}", key, type(value).__name__, versions[key])
+            if is_log_enabled("DEBUG"):
+                if hasattr(value, "shape") and hasattr(value, "columns"):
+                    # DataFrame类型，记录更简洁的信息
+                    logger.debug(f"状态详情: {key} | DataFrame形状: {getattr(value, 'shape', 'unknown')}")
+                else:
+                    logger.debug(f"状态详情: {key} | 新值: {value}")
         else:
-            logger.debug(f"状态未变化: {key}")
+            logger.debug("状态未变化: {}", key)
 
     @staticmethod
-    def _values_are_different(old_value: Any, new_value: Any) -> bool:
-        """安全比较两个值是否不同
+    def get_state_version(key: str) -> int:
+        """获取状态的版本号
 
         Args:
-            old_value: 旧值
-            new_value: 新值
+            key: 状态键名
 
         Returns:
-            值是否不同
+            状态被设置为新对象的次数，未设置过时返回0
         """
-        try:
-            # 如果是相同的对象引用，直接返回False
-            if old_value is new_value:
-                return False
-
-            # 如果类型不同，认为值不同
-            if type(old_value) is not type(new_value):
-                return True
-
-            # 处理DataFrame类型的比较
-            if hasattr(old_value, "shape") and hasattr(new_value, "shape"):
-                # 比较DataFrame的形状和列名
-                if hasattr(old_value, "columns") and hasattr(new_value, "columns"):
-                    return old_value.shape != new_value.shape or list(old_value.columns) != list(new_value.columns)
-                else:
-                    return old_value.shape != new_value.shape
-
-            # 处理None值
-            if old_value is None or new_value is None:
-                return old_value is not new_value
-
-            # 尝试常规比较
-            return old_value != new_value
-
-        except (TypeError, ValueError):
-            # 如果比较出错，假设值不同
-            logger.debug(
-                f"值比较出错，假设值已变化 | 旧值类型: {type(old_value).__name__} | 新值类型: {type(new_value).__name__}"
-            )
-            return True
+        return st.session_state.get(SessionManager.VERSIONS_KEY, {}).get(key, 0)
 
     @staticmethod
     def clear_state(keys: list[str] | None = None) -> None:
         """清空指定状态或全部状态
 
         Args:
-            keys: 要清空的状态键名列表，为None时清空全部状态
+            keys: 要清空的状态键名列表，为None时清空全部应用管理的状态
         """
         if keys:
             logger.info(f"清空指定状态 | 数量: {len(keys)} | 键名: {keys}")
@@ -149,13 +139,23 @@ class SessionManager:
                     old_value = st.session_state[key]
                     del st.session_state[key]
                     cleared_count += 1
-                    logger.debug(f"清空状态: {key} | 原值类型: {type(old_value).__name__}")
+                    logger.debug("清空状态: {} | 原值类型: {}", key, type(old_value).__name__)
+
+            # 清空了带默认值的状态时，下次运行重新初始化以恢复默认值
+            if not SessionManager._MANAGED_KEYS.isdisjoint(keys):
+                st.session_state.pop(SessionManager.INITIALIZED_KEY, None)
 
             logger.info(f"状态清空完成 | 实际清空: {cleared_count}/{len(keys)}")
         else:
-            total_keys = len(st.session_state)
-            st.session_state.clear()
-            logger.info(f"全部状态已清空 | 清空数量: {total_keys}")
+            # 只清空应用管理的状态，保留组件状态和应用注册表等内部状态，避免下次运行重新初始化
+            cleared_count = 0
+            for key in SessionManager._MANAGED_KEYS:
+                if key in st.session_state:
+                    st.session_state.pop(key, None)
+                    cleared_count += 1
+            # 清空后下次运行需要重新初始化默认状态
+            st.session_state.pop(SessionManager.INITIALIZED_KEY, None)
+            logger.info(f"全部状态已清空 | 清空数量: {cleared_count}")
 
     @staticmethod
     def get_cache_key(template: str, **kwargs) -> str:
@@ -169,7 +169,7 @@ class SessionManager:
             生成的缓存键
         """
         cache_key = template.format(**kwargs)
-        logger.debug(f"生成缓存键: {cache_key} | 模板: {template}")
+        logger.debug("生成缓存键: {} | 模板: {}", cache_key, template)
         return cache_key
 
     @staticmethod
@@ -183,7 +183,7 @@ class SessionManager:
             状态是否存在
         """
         exists = key in st.session_state
-        logger.debug(f"状态存在检查: {key} = {exists}")
+        logger.debug("状态存在检查: {} = {}", key, exists)
         return exists
 
     @staticmethod
@@ -193,8 +193,9 @@ class SessionManager:
         Returns:
             所有状态的字典
         """
-        states = {str(k): v for k, v in st.session_state.items()}
-        logger.debug(f"获取所有状态 | 状态数量: {len(states)}")
+        # 会话状态的键名均为字符串，直接复制即可
+        states = dict(st.session_state)
+        logger.debug("获取所有状态 | 状态数量: {}", len(states))
         return states
 
     @staticmethod
@@ -204,12 +205,14 @@ class SessionManager:
         Returns:
             状态摘要信息
         """
-        states = st.session_state
-        summary = {
-            "total_states": len(states),
-            "state_keys": list(states.keys()),
-            "state_types": {key: type(value).__name__ for key, value in states.items()},
-        }
-
-        logger.debug(f"状态摘要 | 总数: {summary['total_states']} | 键名: {summary['state_keys']}")
+        # 一次遍历同时收集键名和类型
+        state_keys = []
+        state_types = {}
+        for key, value in st.session_state.items():
+            state_keys.append(key)
+            state_types[key] = type(value).__name__
+
+        summary = {"total_states": len(state_keys), "state_keys": state_keys, "state_types": state_types}
+
+        logger.debug("状态摘要 | 总数: {} | 键名: {}", summary["total_states"], summary["state_keys"])
         return summary
@@ -10,10 +10,74 @@ import os
 
 import streamlit as st
 
+from app.base.base_app import BaseApp
 from app.core.registry import AppRegistry
 from app.state.session_manager import SessionManager
 from app.utils.logger import log_function_calls, logger
 
+# 已加载的应用实例在会话状态中的键名
+APP_INSTANCES_KEY = "_app_instances"
+# 侧边栏应用选择器的组件键名
+APP_SELECTOR_KEY = "selected_app_name"
+
+# 项目信息的静态内容
+_PROJECT_INFO_MD = """
+**数据表处理系统**
+
+**版本**: 1.0.0
+**作者**: lijianqiao
+
+#### 支持开发
+"""
+
+# 项目信息中展示的图片路径
+_COFFEE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "img", "coffee.png")
+
+
+@st.cache_data(show_spinner=False)
+def _coffee_bytes() -> bytes:
+    """读取项目信息图片（带缓存），重新运行时无需重复读取磁盘
+
+    Returns:
+        图片内容
+    """
+    with open(_COFFEE_PATH, "rb") as f:
+        return f.read()
+
+
+def _show_app_error(app_name: str, error: Exception) -> None:
+    """显示应用加载或渲染失败的错误信息
+
+    Args:
+        app_name: 应用名称
+        error: 异常对象
+    """
+    error_msg = f"应用渲染失败: {app_name} | 错误: {str(error)}"
+    logger.exception(error_msg)
+    st.error(f"应用加载失败: {str(error)}")
+
+    # 显示错误详情
+    with st.expander("错误详情"):
+        st.code(str(error))
+
+
+def _render_app(app_name: str, app_instance: BaseApp) -> None:
+    """渲染应用界面
+
+    Args:
+        app_name: 应用名称
+        app_instance: 应用实例
+    """
+    try:
+        app_instance.render()
+        logger.debug(f"应用界面渲染完成: {app_name}")
+    except Exception as e:
+        _show_app_error(app_name, e)
+
+
+# 作为片段渲染应用界面，应用内的组件交互只重新运行应用本身，不重新渲染侧边栏
+_render_app_fragment = st.fragment(_render_app)
+
 
 class MainUI:
     """主UI界面类
@@ -28,9 +92,19 @@ class MainUI:
             app_registry: 应用注册器
         """
         self.app_registry = app_registry
+
+        # 应用在初始化前已注册完成，缓存应用名称、描述和索引，渲染选择器时无需重复获取
+        available_apps = app_registry.get_available_apps()
+        self._app_names = tuple(available_apps)
+        self._app_desc = available_apps
+        self._name_to_index = {name: index for index, name in enumerate(self._app_names)}
+
+        # 应用实例按会话缓存，主UI在每次重新运行时重建，实例保存在会话状态中跨运行复用
+        self._app_instances = st.session_state.setdefault(APP_INSTANCES_KEY, {})
+
         # 将应用注册器存储到session_state供应用使用
-        if not hasattr(st.session_state, "_app_registry"):
-            st.session_state._app_registry = app_registry
+        if "_app_registry" not in st.session_state:
+            st.session_state["_app_registry"] = app_registry
         logger.info("主UI初始化完成")
 
     @log_function_calls()
@@ -48,11 +122,14 @@ class MainUI:
         # 创建布局
         self._create_main_layout()
 
+        # 当前应用在每次渲染时只读取一次，传递给侧边栏和主内容区
+        current_app = SessionManager.get_state("current_app")
+
         # 渲染侧边栏
-        self._render_sidebar()
+        self._render_sidebar(current_app)
 
         # 渲染主内容区
-        self._render_main_content()
+        self._render_main_content(current_app)
 
         logger.debug("主界面渲染完成")
 
@@ -69,32 +146,38 @@ class MainUI:
         # st.title("📊 数据表处理系统")
         # st.markdown("---")
 
-    @log_function_calls()
-    def _render_sidebar(self) -> None:
-        """渲染侧边栏"""
+    def _render_sidebar(self, current_app: str | None) -> None:
+        """渲染侧边栏
+
+        Args:
+            current_app: 当前应用名称
+        """
         logger.debug("开始渲染侧边栏")
 
         with st.sidebar:
             st.header("数据表处理系统")
 
             # 应用选择器
-            self._render_app_selector()
+            self._render_app_selector(current_app)
 
             st.markdown("---")
 
             # 项目信息
             self._render_project_info()
 
-    @log_function_calls()
-    def _render_app_selector(self) -> None:
-        """渲染应用选择器"""
+    def _render_app_selector(self, current_app: str | None) -> None:
+        """渲染应用选择器
+
+        Args:
+            current_app: 当前应用名称
+        """
         logger.debug("渲染应用选择器")
 
         st.subheader("🎯 选择应用")
 
         try:
-            available_apps = self.app_registry.get_available_apps()
-            app_names = list(available_apps.keys())
+            app_names = self._app_names
+            app_desc = self._app_desc
 
             if not app_names:
                 st.error("没有可用的应用")
@@ -103,24 +186,18 @@ class MainUI:
 
             logger.debug(f"可用应用: {app_names}")
 
-            current_app = SessionManager.get_state("current_app")
-
-            # 设置默认索引
-            if current_app and current_app in app_names:
-                default_index = app_names.index(current_app)
-            else:
-                # 如果当前应用不在列表中或为None，默认选择欢迎页
-                if "欢迎页" in app_names:
-                    default_index = app_names.index("欢迎页")
-                else:
-                    default_index = 0
+            # 设置默认索引，当前应用不在列表中或为None时默认选择欢迎页；
+            # 选择器的值已在会话状态中（包括由欢迎页切换应用时设置）时以会话状态为准，不再传入默认索引
+            index_options = {}
+            if APP_SELECTOR_KEY not in st.session_state:
+                index_options["index"] = self._name_to_index.get(current_app, self._name_to_index.get("欢迎页", 0))
 
             selected_option = st.selectbox(
                 "选择要使用的应用：",
                 options=app_names,
-                index=default_index,
-                format_func=lambda x: f"{x} - {available_apps[x]}",
-                key="selected_app_name",
+                format_func=lambda x: f"{x} - {app_desc[x]}",
+                key=APP_SELECTOR_KEY,
+                **index_options,
             )
 
             # 处理应用选择
@@ -142,29 +219,19 @@ class MainUI:
 
         st.subheader("📋 项目信息")
 
-        project_info = """
-        **数据表处理系统**
+        st.markdown(_PROJECT_INFO_MD, unsafe_allow_html=True)
+        # 在侧边栏上下文中调用，无需再通过 st.sidebar
+        st.image(_coffee_bytes())
+        st.markdown("---")
 
-        **版本**: 1.0.0
-        **作者**: lijianqiao
+    def _render_main_content(self, current_app_name: str | None) -> None:
+        """渲染主内容区
 
-        #### 支持开发
+        Args:
+            current_app_name: 当前应用名称
         """
-
-        st.markdown(project_info, unsafe_allow_html=True)
-        # 获取项目根目录
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        coffee_image_path = os.path.join(project_root, "img", "coffee.png")
-        st.sidebar.image(coffee_image_path)
-        st.sidebar.markdown("---")
-
-    @log_function_calls()
-    def _render_main_content(self) -> None:
-        """渲染主内容区"""
         logger.debug("开始渲染主内容区")
 
-        current_app_name = SessionManager.get_state("current_app")
-
         # 如果没有选择应用，默认显示欢迎页
         if not current_app_name:
             current_app_name = "欢迎页"
@@ -174,32 +241,32 @@ class MainUI:
         # 渲染选中的应用
         self._render_selected_app(current_app_name)
 
-    @log_function_calls()
     def _render_selected_app(self, app_name: str) -> None:
         """渲染选中的应用
 
+        应用切换在整页运行中完成，只有应用界面本身按需作为片段渲染
+
         Args:
             app_name: 应用名称
         """
         logger.info(f"开始渲染应用: {app_name}")
 
         try:
-            # 加载应用实例
-            app_instance = self.app_registry.load_app(app_name)
-            logger.debug(f"应用实例加载成功: {app_name}")
-
-            # 渲染应用界面
-            app_instance.render()
-            logger.debug(f"应用界面渲染完成: {app_name}")
-
+            # 加载应用实例，同一会话内只创建一次
+            app_instance = self._app_instances.get(app_name)
+            if app_instance is None:
+                app_instance = self.app_registry.load_app(app_name)
+                self._app_instances[app_name] = app_instance
+                logger.debug(f"应用实例加载成功: {app_name}")
         except Exception as e:
-            error_msg = f"应用渲染失败: {app_name} | 错误: {str(e)}"
-            logger.exception(error_msg)
-            st.error(f"应用加载失败: {str(e)}")
-
-            # 显示错误详情
-            with st.expander("错误详情"):
-                st.code(str(e))
+            _show_app_error(app_name, e)
+            return
+
+        # 渲染应用界面
+        if app_instance.render_as_fragment:
+            _render_app_fragment(app_name, app_instance)
+        else:
+            _render_app(app_name, app_instance)
 
     def get_current_app(self) -> str | None:
         """获取当前选中的应用
@@ -6,6 +6,6 @@
 @Docs: 工具模块初始化
 """
 
-from .logger import log_function_calls, logger
+from .logger import is_log_enabled, log_function_calls, logger
 
-__all__ = ["logger", "log_function_calls"]
+__all__ = ["logger", "log_function_calls", "is_log_enabled"]
@@ -0,0 +1,93 @@
+"""
+@Author: li
+@Email: lijianqiao2906@live.com
+@FileName: cache_utils.py
+@DateTime: 2026-10-15
+@Docs: 缓存工具：Streamlit 缓存的 DataFrame 指纹与统计缓存
+"""
+
+from typing import Any
+
+import polars as pl
+import streamlit as st
+
+from config.app_config import AppConfig
+
+# 指纹中参与内容哈希的抽样行数上限
+FINGERPRINT_SAMPLE_ROWS = 64
+
+
+def dataframe_fingerprint(df: pl.DataFrame) -> tuple:
+    """生成DataFrame的轻量指纹
+
+    避免 Streamlit 对整个 DataFrame 内容做哈希，仅使用对象标识、形状、结构和等距抽样行的哈希；
+    对象被回收后 id 可能被新对象复用，抽样行哈希用于区分内容不同的DataFrame
+
+    Args:
+        df: 数据DataFrame
+
+    Returns:
+        指纹元组
+    """
+    step = max(df.height // FINGERPRINT_SAMPLE_ROWS, 1)
+    sample_hashes = tuple(df.gather_every(step).hash_rows().to_list()) if df.width else ()
+    return (id(df), df.height, tuple(df.columns), tuple(map(str, df.dtypes)), sample_hashes)
+
+
+# st.cache_data 使用的哈希函数映射
+DATAFRAME_HASH_FUNCS = {pl.DataFrame: dataframe_fingerprint}
+# 以DataFrame为参数的缓存保留的最大条目数，指纹包含对象标识，每个新的DataFrame都会新增条目
+DATAFRAME_CACHE_MAX_ENTRIES = 32
+
+# 行数超过该阈值时，唯一值数使用 HyperLogLog 近似计算
+APPROX_UNIQUE_THRESHOLD = 100_000
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs=DATAFRAME_HASH_FUNCS,
+    max_entries=DATAFRAME_CACHE_MAX_ENTRIES,
+    ttl=AppConfig.CACHE_TTL,
+)
+def compute_column_stats(df: pl.DataFrame, columns: tuple[str, ...]) -> list[dict[str, Any]]:
+    """一次性计算多个列的统计信息（带缓存）
+
+    Args:
+        df: 数据DataFrame
+        columns: 需要统计的列名元组
+
+    Returns:
+        每列的统计信息列表，包含列名、数据类型、空值数、唯一值数，以及唯一值数是否为近似值
+    """
+    schema = df.schema
+    columns = tuple(col for col in columns if col in schema)
+    if not columns:
+        return []
+
+    # 大数据量时精确去重需要构建完整哈希集合，预览面板使用近似值即可
+    approximate = df.height > APPROX_UNIQUE_THRESHOLD
+    unique_expr = pl.col(columns).approx_n_unique() if approximate else pl.col(columns).n_unique()
+
+    # 惰性查询只投影需要的列，空值数与唯一值数在同一个查询计划中按列并行计算
+    stats = (
+        df.lazy()
+        .select(
+            [
+                pl.col(columns).null_count().name.suffix("__nc"),
+                unique_expr.name.suffix("__nu"),
+            ]
+        )
+        .collect()
+        .row(0, named=True)
+    )
+
+    return [
+        {
+            "name": col,
+            "dtype": str(schema[col]),
+            "null_count": stats[f"{col}__nc"],
+            "unique_count": stats[f"{col}__nu"],
+            "unique_approx": approximate,
+        }
+        for col in columns
+    ]
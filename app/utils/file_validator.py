@@ -26,6 +26,9 @@ class FileValidator:
         """
         self.max_size = max_size
         self.supported_formats = FileConfig.SUPPORTED_FORMATS
+        # 预先计算扩展名集合和大小限制文本，验证每个文件时直接复用
+        self._ext_set = frozenset(fmt.lower() for fmt in self.supported_formats)
+        self._max_size_mb_str = f"{max_size / 1024 / 1024:.0f}MB"
 
     def validate_file_format(self, file) -> bool:
         """验证文件格式
@@ -36,8 +39,7 @@ class FileValidator:
         Returns:
             格式是否支持
         """
-        filename = file.name.lower()
-        return any(filename.endswith(fmt) for fmt in self.supported_formats)
+        return os.path.splitext(file.name)[1].lower() in self._ext_set
 
     def validate_file_size(self, file) -> bool:
         """验证文件大小
@@ -81,13 +83,19 @@ class FileValidator:
         validation_result: dict[str, Any] = {"valid": True, "errors": [], "warnings": []}
 
         try:
-            # 简单的内容检查
-            file.seek(0)
-            first_bytes = file.read(1024)
-            file.seek(0)
+            # 优先使用已知的文件大小判断是否为空，无需读取文件内容；
+            # getvalue() 返回共享的底层bytes，不复制文件内容
+            if hasattr(file, "size"):
+                file_size = file.size
+            elif hasattr(file, "getvalue"):
+                file_size = len(file.getvalue())
+            else:
+                file.seek(0)
+                file_size = len(file.read(1))
+                file.seek(0)
 
             # 检查是否为空文件
-            if len(first_bytes) == 0:
+            if file_size == 0:
                 validation_result["valid"] = False
                 validation_result["errors"].append("文件为空")
 
@@ -116,7 +124,7 @@ class FileValidator:
         # 大小验证
         if not self.validate_file_size(file):
             result["valid"] = False
-            result["errors"].append(f"文件大小超过限制 ({self.max_size / 1024 / 1024:.0f}MB)")
+            result["errors"].append(f"文件大小超过限制 ({self._max_size_mb_str})")
 
         # 内容验证
         content_result = self.validate_file_content(file)
@@ -8,7 +8,7 @@
 """
 
 import base64
-import secrets
+import os
 
 
 def generate_secret_key(length: int = 32) -> str:
@@ -21,7 +21,7 @@ def generate_secret_key(length: int = 32) -> str:
     返回:
         str: base64编码的密钥字符串
     """
-    return base64.b64encode(secrets.token_bytes(length)).decode()
+    return base64.b64encode(os.urandom(length)).decode("ascii")
 
 
 if __name__ == "__main__":
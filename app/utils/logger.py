@@ -13,12 +13,37 @@ import sys
 from functools import wraps
 from pathlib import Path
 
+import polars as pl
 from dotenv import load_dotenv
 from loguru import logger
 
 load_dotenv()
 
 
+# 日志格式，extra 为空时不输出该字段
+_LOG_FORMAT_PREFIX = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+)
+_LOG_FORMAT = _LOG_FORMAT_PREFIX + "<level>{message}</level>\n{exception}"
+_LOG_FORMAT_WITH_EXTRA = _LOG_FORMAT_PREFIX + "{extra} | <level>{message}</level>\n{exception}"
+
+
+def _log_format(record) -> str:
+    """根据日志记录选择格式
+
+    loguru 会缓存每个格式字符串的解析结果，这里只返回预先定义的两个格式之一
+
+    Args:
+        record: loguru 日志记录
+
+    Returns:
+        日志格式字符串
+    """
+    return _LOG_FORMAT_WITH_EXTRA if record["extra"] else _LOG_FORMAT
+
+
 def setup_logger() -> None:
     """配置日志系统"""
     # 移除默认处理器
@@ -30,12 +55,7 @@ def setup_logger() -> None:
     log_dir.mkdir(exist_ok=True)
 
     # 日志格式
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-        "{extra} | <level>{message}</level>"
-    )
+    log_format = _log_format
 
     # 控制台输出
     logger.add(
@@ -70,6 +90,46 @@ def setup_logger() -> None:
     )
 
 
+def is_log_enabled(level: str = "DEBUG") -> bool:
+    """检查是否存在接收该级别日志的处理器
+
+    用于在热点路径上跳过仅为日志准备的计算
+
+    Args:
+        level: 日志级别名称
+
+    Returns:
+        该级别的日志是否会被输出
+    """
+    return logger._core.min_level <= logger.level(level).no
+
+
+def _format_value(value) -> str:
+    """格式化日志中的参数或返回值
+
+    Polars 对象的 repr 会渲染表格，这里只输出形状
+
+    Args:
+        value: 待格式化的值
+
+    Returns:
+        格式化后的字符串
+    """
+    if isinstance(value, pl.DataFrame):
+        return f"<DataFrame shape={value.shape}>"
+    if isinstance(value, pl.LazyFrame):
+        return "<LazyFrame>"
+    if isinstance(value, pl.Series):
+        return f"<Series name={value.name!r} len={value.len()}>"
+    if isinstance(value, list | tuple):
+        items = ", ".join(_format_value(item) for item in value)
+        return f"[{items}]" if isinstance(value, list) else f"({items})"
+    if isinstance(value, dict):
+        items = ", ".join(f"{key!r}: {_format_value(item)}" for key, item in value.items())
+        return f"{{{items}}}"
+    return str(value)
+
+
 def log_function_calls(*, include_args: bool = False, include_result: bool = False):
     """简单的函数调用日志装饰器
 
@@ -78,23 +138,38 @@ def log_function_calls(*, include_args: bool = False, include_result: bool = Fal
         include_result: 是否记录返回值
     """
 
+    # 装饰时确定调用日志的级别编号，调用时只需比较一次
+    info_no = logger.level("INFO").no
+
     def decorator(func):
+        func_name = func.__name__
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            func_name = func.__name__
+            # 调用日志使用 INFO 级别，未启用时直接调用原函数
+            if logger._core.min_level > info_no:
+                return func(*args, **kwargs)
+
+            # 参数和返回值只在日志实际输出时才格式化
+            lazy_logger = logger.opt(lazy=True)
 
             # 记录函数调用
-            extra = {"function": func_name}
             if include_args:
-                extra["args"] = f"args={args}, kwargs={kwargs}"
-
-            logger.info("Function called", **extra)
+                lazy_logger.info(
+                    "Function called",
+                    function=lambda: func_name,
+                    args=lambda: f"args={_format_value(args)}, kwargs={_format_value(kwargs)}",
+                )
+            else:
+                logger.info("Function called", function=func_name)
 
             try:
                 result = func(*args, **kwargs)
 
                 if include_result:
-                    logger.info("Function completed", function=func_name, result=str(result)[:200])
+                    lazy_logger.info(
+                        "Function completed", function=lambda: func_name, result=lambda: _format_value(result)[:200]
+                    )
                 else:
                     logger.info("Function completed", function=func_name)
 
@@ -112,4 +187,4 @@ def log_function_calls(*, include_args: bool = False, include_result: bool = Fal
 setup_logger()
 
 # 导出logger实例，直接使用loguru的功能
-__all__ = ["logger", "log_function_calls"]
+__all__ = ["logger", "log_function_calls", "is_log_enabled"]
@@ -6,9 +6,33 @@
 @Docs: 内存管理工具
 """
 
+import time
+from typing import Any
+
 import polars as pl
 import psutil
 
+# 内存信息采样的有效期（秒），同一次渲染中连续查询时复用同一次采样
+VMEM_TTL = 0.1
+
+# 最近一次采样的时间和结果
+_last_vmem: tuple[float, Any] = (0.0, None)
+
+
+def _vmem() -> Any:
+    """获取系统内存信息（短时缓存）
+
+    Returns:
+        psutil.virtual_memory() 的结果
+    """
+    global _last_vmem
+    now = time.monotonic()
+    sampled_at, vmem = _last_vmem
+    if vmem is None or now - sampled_at >= VMEM_TTL:
+        vmem = psutil.virtual_memory()
+        _last_vmem = (now, vmem)
+    return vmem
+
 
 class MemoryManager:
     """内存管理器
@@ -23,7 +47,7 @@ class MemoryManager:
         Returns:
             内存使用率（0-1之间）
         """
-        return psutil.virtual_memory().percent / 100
+        return _vmem().percent / 100
 
     @staticmethod
     def check_memory_available(required_mb: float) -> bool:
@@ -35,31 +59,47 @@ class MemoryManager:
         Returns:
             是否有足够内存
         """
-        available_mb = psutil.virtual_memory().available / 1024 / 1024
+        available_mb = _vmem().available / 1024 / 1024
         return available_mb > required_mb
 
     @staticmethod
-    def optimize_dataframe(df: pl.DataFrame) -> pl.DataFrame:
+    def optimize_dataframe(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
         """优化DataFrame内存使用
 
+        传入LazyFrame时统计和转换都在惰性查询中完成，使用流式引擎分批处理，只在最后收集一次
+
         Args:
-            df: 待优化的DataFrame
+            df: 待优化的DataFrame或LazyFrame
 
         Returns:
             优化后的DataFrame
         """
-        # 转换数据类型以节省内存
-        optimized_df = df
-
-        for col in df.columns:
-            if df[col].dtype == pl.Utf8:
-                # 尝试转换为分类类型
-                if len(df) > 0:  # 避免除零错误
-                    unique_ratio = df[col].n_unique() / len(df)
-                    if unique_ratio < 0.5:  # 如果唯一值比例小于50%
-                        optimized_df = optimized_df.with_columns(pl.col(col).cast(pl.Categorical))
-
-        return optimized_df
+        is_lazy = isinstance(df, pl.LazyFrame)
+        lf = df if is_lazy else df.lazy()
+
+        utf8_cols = lf.select(pl.col(pl.Utf8)).collect_schema().names()
+        if not utf8_cols:
+            return df.collect(engine="streaming") if is_lazy else df
+
+        # 一次查询计算所有字符串列的唯一值数量和总行数，按位置命名避免与列名冲突
+        stats = lf.select(
+            *(pl.col(col).n_unique().alias(str(i)) for i, col in enumerate(utf8_cols)),
+            pl.len().alias("rows"),
+        )
+        *unique_counts, height = stats.collect(engine="streaming").row(0)
+
+        # 唯一值比例小于50%的列转换为分类类型，一次完成所有转换以节省内存
+        casts = []
+        if height > 0:  # 避免除零错误
+            casts = [
+                pl.col(col).cast(pl.Categorical)
+                for col, unique_count in zip(utf8_cols, unique_counts, strict=True)
+                if unique_count / height < 0.5
+            ]
+
+        if is_lazy:
+            return lf.with_columns(casts).collect(engine="streaming")
+        return df.with_columns(casts) if casts else df
 
     @staticmethod
     def estimate_processing_memory(df: pl.DataFrame, factor: float = 2.0) -> float:
@@ -82,7 +122,7 @@ class MemoryManager:
         Returns:
             内存信息字典
         """
-        memory = psutil.virtual_memory()
+        memory = _vmem()
         return {
             "total_mb": memory.total / 1024 / 1024,
             "available_mb": memory.available / 1024 / 1024,
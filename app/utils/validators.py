@@ -10,6 +10,9 @@ from typing import Any
 
 import polars as pl
 
+# Python内置类型对应的Polars数据类型，用于比较期望类型
+_PY_TO_PL = {str: pl.Utf8, int: pl.Int64, float: pl.Float64, bool: pl.Boolean}
+
 
 class DataValidator:
     """数据验证器
@@ -27,11 +30,12 @@ class DataValidator:
         Returns:
             验证结果字典
         """
+        row_count, column_count = df.shape if df is not None else (0, 0)
         return {
-            "is_valid": df is not None and len(df) > 0,
-            "row_count": len(df) if df is not None else 0,
-            "column_count": len(df.columns) if df is not None else 0,
-            "has_data": df is not None and len(df) > 0 and len(df.columns) > 0,
+            "is_valid": row_count > 0,
+            "row_count": row_count,
+            "column_count": column_count,
+            "has_data": row_count > 0 and column_count > 0,
         }
 
     @staticmethod
@@ -49,7 +53,9 @@ class DataValidator:
             return {"is_valid": False, "missing_columns": required_columns, "existing_columns": []}
 
         existing_columns = df.columns
-        missing_columns = [col for col in required_columns if col not in existing_columns]
+        # 转换为集合后逐个查找，保持必需列的原有顺序
+        existing_set = set(existing_columns)
+        missing_columns = [col for col in required_columns if col not in existing_set]
 
         return {
             "is_valid": len(missing_columns) == 0,
@@ -58,12 +64,12 @@ class DataValidator:
         }
 
     @staticmethod
-    def validate_data_types(df: pl.DataFrame, expected_types: dict[str, type]) -> dict[str, Any]:
+    def validate_data_types(df: pl.DataFrame, expected_types: dict[str, Any]) -> dict[str, Any]:
         """验证数据类型
 
         Args:
             df: 待验证的DataFrame
-            expected_types: 期望的数据类型字典
+            expected_types: 期望的数据类型字典，值可以是Polars数据类型、类型名字符串或str、int、float、bool
 
         Returns:
             验证结果字典
@@ -71,14 +77,22 @@ class DataValidator:
         if df is None:
             return {"is_valid": False, "type_mismatches": list(expected_types.keys())}
 
+        schema = df.schema
         type_mismatches = []
         for column, expected_type in expected_types.items():
-            if column in df.columns:
-                actual_type = df[column].dtype
+            actual_type = schema.get(column)
+            if actual_type is not None:
                 # 这里可以添加更详细的类型检查逻辑
-                if str(actual_type) != str(expected_type):
+                if isinstance(expected_type, str):
+                    # 类型名字符串按字符串形式比较，如 "Int64"
+                    expected_dtype = expected_type
+                    matched = str(actual_type) == expected_type
+                else:
+                    expected_dtype = _PY_TO_PL.get(expected_type, expected_type)
+                    matched = actual_type == expected_dtype
+                if not matched:
                     type_mismatches.append(
-                        {"column": column, "expected": str(expected_type), "actual": str(actual_type)}
+                        {"column": column, "expected": str(expected_dtype), "actual": str(actual_type)}
                     )
 
         return {"is_valid": len(type_mismatches) == 0, "type_mismatches": type_mismatches}
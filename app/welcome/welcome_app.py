@@ -11,8 +11,30 @@ import streamlit as st
 
 from app.base.base_app import BaseApp
 from app.state.session_manager import SessionManager
+from app.ui.ui import APP_SELECTOR_KEY
 from app.utils.logger import log_function_calls, logger
 
+# 帮助部分的静态内容
+_FAQ_MD = """
+**Q: 支持哪些文件格式？**
+A: CSV 和 Excel 文件（.csv, .xlsx, .xls）
+
+**Q: 文件大小限制？**
+A: 单个文件最大 100MB
+
+**Q: 数据是否会保存？**
+A: 仅在浏览器会话中处理，不保存到服务器
+"""
+
+_SUPPORT_MD = """
+**技术支持**
+📧 lijianqiao2906@live.com
+
+**系统信息**
+- 版本: 1.0.0
+- 技术栈: Streamlit + Polars
+"""
+
 
 class WelcomeApp(BaseApp):
     """欢迎页应用
@@ -20,6 +42,9 @@ class WelcomeApp(BaseApp):
     提供系统介绍、功能说明、快速开始指南等内容
     """
 
+    # 应用按钮在回调中切换应用，需在整页运行中渲染，侧边栏才能同步更新
+    render_as_fragment = False
+
     @log_function_calls(include_args=False)
     def __init__(self):
         """初始化欢迎页应用"""
@@ -68,11 +93,15 @@ class WelcomeApp(BaseApp):
         # 快速开始指南和功能特色
         self._render_main_content()
 
+        # 应用列表在每次渲染时只获取一次，供系统状态和应用预览共用
+        app_registry = self._get_app_registry()
+        available_apps = app_registry.get_available_apps() if app_registry else None
+
         # 系统状态
-        self._render_system_status()
+        self._render_system_status(available_apps)
 
         # 应用预览
-        self._render_app_preview()
+        self._render_app_preview(available_apps)
 
         # 帮助信息
         self._render_help_section()
@@ -104,21 +133,19 @@ class WelcomeApp(BaseApp):
         # 简化为仪表盘样式，不显示详细的使用说明
         pass
 
-    def _render_system_status(self) -> None:
-        """渲染系统状态"""
+    def _render_system_status(self, available_apps: dict | None) -> None:
+        """渲染系统状态
+
+        Args:
+            available_apps: 应用名称到描述的映射，无法获取应用注册器时为None
+        """
         logger.debug("渲染系统状态")
 
         st.markdown("## 📊 系统状态")
 
-        try:
-            # 尝试获取应用注册器
-            app_registry = self._get_app_registry()
-
-            if app_registry:
-                available_apps = app_registry.get_available_apps()
-            else:
-                available_apps = {}
+        available_apps = available_apps or {}
 
+        try:
             col1, col2, col3, col4 = st.columns(4)
 
             with col1:
@@ -148,19 +175,19 @@ class WelcomeApp(BaseApp):
 
         st.markdown("---")
 
-    def _render_app_preview(self) -> None:
-        """渲染可用应用"""
+    def _render_app_preview(self, available_apps: dict | None) -> None:
+        """渲染可用应用
+
+        Args:
+            available_apps: 应用名称到描述的映射，无法获取应用注册器时为None
+        """
         logger.debug("渲染可用应用")
 
         try:
-            app_registry = self._get_app_registry()
-
-            if not app_registry:
+            if available_apps is None:
                 st.warning("无法获取应用列表")
                 return
 
-            available_apps = app_registry.get_available_apps()
-
             # 过滤掉欢迎页本身
             filtered_apps = {k: v for k, v in available_apps.items() if k != "欢迎页"}
 
@@ -175,28 +202,39 @@ class WelcomeApp(BaseApp):
 
             for i, (app_name, app_description) in enumerate(filtered_apps.items()):
                 with cols[i % 3]:
-                    with st.container():
-                        st.markdown(
-                            f"""
-                        <div style="border: 1px solid #ddd; border-radius: 8px; padding: 16px; margin: 8px 0;">
-                            <h4>{app_name}</h4>
-                            <p style="color: #666; font-size: 14px;">{app_description}</p>
-                        </div>
-                        """,
-                            unsafe_allow_html=True,
+                    # 使用原生带边框的容器作为卡片，无需逐个渲染HTML
+                    with st.container(border=True):
+                        st.subheader(app_name)
+                        st.caption(app_description)
+
+                        # 在回调中切换应用，点击后的这次运行即渲染新应用，无需再调用 st.rerun()
+                        st.button(
+                            f"使用 {app_name}",
+                            key=f"select_{app_name}",
+                            on_click=self._select_app,
+                            args=(app_name,),
+                            use_container_width=True,
                         )
 
-                        if st.button(f"使用 {app_name}", key=f"select_{app_name}", use_container_width=True):
-                            SessionManager.set_state("current_app", app_name)
-                            logger.info(f"从欢迎页选择应用: {app_name}")
-                            st.rerun()
-
         except Exception as e:
             logger.exception(f"可用应用渲染失败: {str(e)}")
             st.error("应用列表加载失败")
 
         st.markdown("---")
 
+    @staticmethod
+    def _select_app(app_name: str) -> None:
+        """切换到指定应用，作为按钮回调在重新运行前执行
+
+        同步更新侧边栏应用选择器的值，避免选择器按旧值把应用切换回来
+
+        Args:
+            app_name: 应用名称
+        """
+        SessionManager.set_state("current_app", app_name)
+        st.session_state[APP_SELECTOR_KEY] = app_name
+        logger.info(f"从欢迎页选择应用: {app_name}")
+
     def _render_help_section(self) -> None:
         """渲染帮助部分"""
         logger.debug("渲染帮助部分")
@@ -205,27 +243,11 @@ class WelcomeApp(BaseApp):
 
         with col1:
             with st.expander("❓ 常见问题", expanded=False):
-                st.markdown("""
-                **Q: 支持哪些文件格式？**
-                A: CSV 和 Excel 文件（.csv, .xlsx, .xls）
-
-                **Q: 文件大小限制？**
-                A: 单个文件最大 100MB
-
-                **Q: 数据是否会保存？**
-                A: 仅在浏览器会话中处理，不保存到服务器
-                """)
+                st.markdown(_FAQ_MD)
 
         with col2:
             with st.expander("📞 帮助与支持", expanded=False):
-                st.markdown("""
-                **技术支持**
-                📧 lijianqiao2906@live.com
-
-                **系统信息**
-                - 版本: 1.0.0
-                - 技术栈: Streamlit + Polars
-                """)
+                st.markdown(_SUPPORT_MD)
 
     def _get_app_registry(self):
         """获取应用注册器
@@ -233,15 +255,5 @@ class WelcomeApp(BaseApp):
         Returns:
             应用注册器实例，获取失败时返回None
         """
-        try:
-            # 从 session_state 中获取，这需要在主应用中设置
-            if hasattr(st.session_state, "_app_registry"):
-                return st.session_state._app_registry
-
-            # 或者尝试从全局导入（需要确保已初始化）
-            # 这里返回None，让调用方处理
-            return None
-
-        except Exception as e:
-            logger.debug(f"获取应用注册器失败: {str(e)}")
-            return None
+        # 从 session_state 中获取，这需要在主应用中设置；未设置时返回None，让调用方处理
+        return st.session_state.get("_app_registry")
@@ -6,6 +6,8 @@
 @Docs: 应用程序相关配置
 """
 
+import os
+
 
 class AppConfig:
     """应用配置类"""
@@ -18,6 +20,9 @@ class AppConfig:
     # 性能配置
     MAX_MEMORY_USAGE = 0.8  # 最大内存使用率
     CHUNK_SIZE = 10000  # 批处理大小
+    POLARS_MAX_THREADS = min(os.cpu_count() or 8, 16)  # Polars 线程池上限，避免多核机器上线程过多
+    POLARS_STREAMING_CHUNK_SIZE = 50000  # Polars 流式引擎每批处理的行数
+    XLSX_CONSTANT_MEMORY_CELLS = 1_000_000  # 导出xlsx单元格数超过该值时使用 constant_memory 模式，没有表格样式
 
     # 缓存配置
     CACHE_TTL = 3600  # 缓存生存时间（秒）
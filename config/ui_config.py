@@ -22,9 +22,13 @@ class UIConfig:
     PROGRESS_BAR_HEIGHT = 20
     ERROR_MESSAGE_DURATION = 5000
 
+    # 字段选择配置（字段数量超过阈值时启用搜索筛选，并限制渲染的选项数量）
+    COLUMN_FILTER_THRESHOLD = 200
+    MAX_COLUMN_OPTIONS = 100
+
     # 导出配置
     DEFAULT_EXPORT_FORMAT = "xlsx"
-    EXPORT_FORMATS = ["xlsx"]
+    EXPORT_FORMATS = ["xlsx", "csv", "parquet"]
 
     # 颜色主题
     COLORS = {"primary": "#1f77b4", "success": "#2ca02c", "warning": "#ff7f0e", "danger": "#d62728", "info": "#17a2b8"}